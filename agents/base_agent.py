@@ -4,11 +4,49 @@ Core agent functionality for interacting with Gemini and DeepSeek APIs
 """
 import google.generativeai as genai
 from openai import OpenAI
+import random
 import time
+from functools import lru_cache
 from typing import Optional
 from config import Config
 
 
+@lru_cache(maxsize=None)
+def _configure_gemini(api_key: str) -> None:
+    """Configure the Gemini SDK once per API key (shared by all agents)"""
+    genai.configure(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def _deepseek_client(api_key: str) -> OpenAI:
+    """Process-wide DeepSeek client so every agent reuses one keep-alive pool"""
+    # Keeps the SDK's default retries for connection errors, timeouts and 5xx
+    return OpenAI(
+        api_key=api_key,
+        base_url="https://api.deepseek.com"
+    )
+
+
+# Rate-limit retries: wait only when the provider actually returns 429
+MAX_RATE_LIMIT_RETRIES = 5
+MAX_RETRY_BACKOFF = 30.0
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """True for provider 429 / quota-exhausted errors (OpenAI RateLimitError, Gemini ResourceExhausted)"""
+    status = getattr(error, 'status_code', None) or getattr(error, 'code', None)
+    return status == 429 or type(error).__name__ in ('RateLimitError', 'ResourceExhausted')
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait: the provider's Retry-After header, else exponential backoff with jitter (both capped)"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return min(MAX_RETRY_BACKOFF, max(0.0, float(headers.get('retry-after'))))
+    except (TypeError, ValueError):
+        return min(MAX_RETRY_BACKOFF, 2.0 ** attempt) * random.uniform(0.5, 1.0)
+
+
 class BaseAgent:
     """
     Base class for all investment analysis agents.
@@ -66,7 +104,7 @@ class BaseAgent:
                 "GEMINI_API_KEY not found. Please add it to your .env file."
             )
         
-        genai.configure(api_key=Config.GEMINI_API_KEY)
+        _configure_gemini(Config.GEMINI_API_KEY)
         
         # Configure generation settings
         generation_config = {
@@ -105,11 +143,8 @@ class BaseAgent:
                 "DEEPSEEK_API_KEY not found. Please add it to your .env file."
             )
         
-        # Initialize OpenAI client with DeepSeek endpoint
-        self.client = OpenAI(
-            api_key=Config.DEEPSEEK_API_KEY,
-            base_url="https://api.deepseek.com"
-        )
+        # Shared OpenAI client with DeepSeek endpoint (reused across agents/tickers)
+        self.client = _deepseek_client(Config.DEEPSEEK_API_KEY)
         
         print(f"✅ {self.name} initialized with {self.model_name} (DeepSeek)")
     
@@ -146,26 +181,7 @@ FINANCIAL DATA TO ANALYZE:
 Please provide your analysis now. Be specific, cite numbers from the data, and stay true to your role.
 """
             
-            # Generate response based on provider
-            if self.provider == "deepseek":
-                # Set max_tokens based on model type
-                # DeepSeek Reasoner needs more tokens for reasoning chains + output
-                max_tokens = 32768 if "reasoner" in self.model_name.lower() else 16384
-                
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": full_prompt}
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=max_tokens
-                )
-                analysis = response.choices[0].message.content
-            else:
-                # Gemini API
-                response = self.model.generate_content(full_prompt)
-                analysis = response.text
+            analysis = self._generate(full_prompt)
             
             print(f"✅ {self.name} completed analysis")
             
@@ -176,5 +192,48 @@ Please provide your analysis now. Be specific, cite numbers from the data, and s
             print(error_msg)
             return error_msg
     
+    def _generate(self, full_prompt: str) -> str:
+        """
+        Send the prompt to the configured provider
+        
+        Rate-limited (429) requests are retried after the provider's Retry-After
+        delay (or a jittered exponential backoff); other errors propagate.
+        
+        Args:
+            full_prompt: Complete prompt text
+        
+        Returns:
+            Model response text
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                # Generate response based on provider
+                if self.provider == "deepseek":
+                    # Set max_tokens based on model type
+                    # DeepSeek Reasoner needs more tokens for reasoning chains + output
+                    max_tokens = 32768 if "reasoner" in self.model_name.lower() else 16384
+                    
+                    response = self.client.chat.completions.create(
+                        model=self.model_name,
+                        messages=[
+                            {"role": "system", "content": self.system_prompt},
+                            {"role": "user", "content": full_prompt}
+                        ],
+                        temperature=self.temperature,
+                        max_tokens=max_tokens
+                    )
+                    return response.choices[0].message.content
+                
+                # Gemini API
+                response = self.model.generate_content(full_prompt)
+                return response.text
+            
+            except Exception as e:
+                if attempt == MAX_RATE_LIMIT_RETRIES or not _is_rate_limited(e):
+                    raise
+                delay = _retry_delay(e, attempt)
+                print(f"   ⏳ {self.name} rate limited, retrying in {delay:.1f}s...")
+                time.sleep(delay)
+    
     def __str__(self):
         return f"{self.name} ({self.role}) using {self.model_name}"
@@ -225,7 +225,8 @@ Remember to:
                     forward_eps=forward_eps if forward_eps else 0,
                     historical_pe_5y=trailing_pe if trailing_pe else 20,  # Fallback
                     quality_score=quality_score,
-                    growth_rate=growth_rate
+                    growth_rate=growth_rate,
+                    build_reasoning=True
                 )
                 results['pe'] = pe_result
             else:
@@ -240,7 +241,8 @@ Remember to:
                         fcf_per_share=fcf_per_share,
                         historical_pfcf_5y=20,  # Default assumption
                         quality_score=quality_score,
-                        growth_rate=growth_rate
+                        growth_rate=growth_rate,
+                        build_reasoning=True
                     )
                     results['pfcf'] = pfcf_result
                 else:
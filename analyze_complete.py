@@ -15,6 +15,7 @@ Usage:
 """
 import sys
 import argparse
+import asyncio
 import json
 from datetime import datetime
 from typing import Dict, List
@@ -37,6 +38,11 @@ from utils.display import (
     print_warning
 )
 
+# Canonical CIO recommendation vocabulary (interned, shared with the E2E checks)
+VALID_RECOMMENDATIONS = frozenset(
+    sys.intern(rec) for rec in ('STRONG BUY', 'BUY', 'HOLD', 'REDUCE', 'SELL')
+)
+
 
 class InvestmentAnalyzer:
     """Complete investment analysis system integrating all 6 agents"""
@@ -141,6 +147,18 @@ class InvestmentAnalyzer:
                 print_error(f"❌ Analysis failed: {str(e)}")
             raise
     
+    async def analyze_async(self) -> Dict:
+        """
+        Run the analysis in a worker thread so several tickers can overlap
+        
+        The agent SDK clients are blocking, so the pipeline itself is unchanged;
+        awaiting this lets callers schedule independent analyses with asyncio.
+        
+        Returns:
+            Dictionary with all analysis results
+        """
+        return await asyncio.to_thread(self.analyze)
+    
     def _collect_data(self) -> tuple:
         """Stage 1: Collect comprehensive financial data"""
         fetcher = DataFetcherV3(self.ticker)
@@ -287,36 +305,52 @@ class InvestmentAnalyzer:
         
         print("="*80 + "\n")
     
-    def save_results(self, output_dir: str = "output", format: str = "json"):
-        """Save analysis results to file"""
+    def save_results(self, output_dir: str = "output", format: str = "json",
+                     return_payload: bool = False):
+        """
+        Save analysis results to file
+        
+        Args:
+            output_dir: Directory to write into
+            format: 'json' or 'txt'
+            return_payload: Also return the dict/text that was written
+        
+        Returns:
+            Path written (None for unknown formats), or (path, payload) if return_payload
+        """
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = payload = None
         
         if format == "json":
             filename = f"{output_dir}/{self.ticker}_{timestamp}.json"
+            payload = self.results
             with open(filename, 'w') as f:
-                json.dump(self.results, f, indent=2)
+                json.dump(payload, f, indent=2)
             print(f"✅ Results saved to: {filename}")
         
         elif format == "txt":
             filename = f"{output_dir}/{self.ticker}_{timestamp}.txt"
+            decision = self.results['cio_synthesis']['decision']
+            payload = (
+                f"Investment Analysis Report: {self.ticker}\n"
+                f"Generated: {self.results['timestamp']}\n"
+                f"{'='*80}\n\n"
+                f"EXECUTIVE SUMMARY\n"
+                f"{'-'*80}\n"
+                f"Recommendation: {decision.get('recommendation', 'N/A')}\n"
+                f"Conviction: {decision.get('conviction', 0)}/10\n"
+                f"Position Size: {decision.get('position_size', 0):.2f}%\n\n"
+                f"\nFULL CIO SYNTHESIS\n"
+                f"{'='*80}\n\n"
+                f"{self.results['cio_synthesis']['full_synthesis']}"
+            )
             with open(filename, 'w') as f:
-                f.write(f"Investment Analysis Report: {self.ticker}\n")
-                f.write(f"Generated: {self.results['timestamp']}\n")
-                f.write("="*80 + "\n\n")
-                
-                f.write("EXECUTIVE SUMMARY\n")
-                f.write("-"*80 + "\n")
-                decision = self.results['cio_synthesis']['decision']
-                f.write(f"Recommendation: {decision.get('recommendation', 'N/A')}\n")
-                f.write(f"Conviction: {decision.get('conviction', 0)}/10\n")
-                f.write(f"Position Size: {decision.get('position_size', 0):.2f}%\n\n")
-                
-                f.write("\nFULL CIO SYNTHESIS\n")
-                f.write("="*80 + "\n\n")
-                f.write(self.results['cio_synthesis']['full_synthesis'])
+                f.write(payload)
             
             print(f"✅ Results saved to: {filename}")
+        
+        return (filename, payload) if return_payload else filename
 
 
 def analyze_single_stock(ticker: str, save: bool = False, format: str = "json", 
@@ -396,8 +430,9 @@ def analyze_single_stock(ticker: str, save: bool = False, format: str = "json",
 
 
 def analyze_multiple_stocks(tickers: List[str], save: bool = False, compare: bool = False, 
-                          model: str = None, show_full: bool = False):
-    """Analyze multiple stocks"""
+                          model: str = None, show_full: bool = False, results: List[Dict] = None):
+    """Analyze multiple stocks (tickers already present in `results` are reused, not re-run)"""
+    precomputed = {r['ticker']: r for r in results or ()}
     results = []
     
     for i, ticker in enumerate(tickers, 1):
@@ -407,7 +442,12 @@ def analyze_multiple_stocks(tickers: List[str], save: bool = False, compare: boo
         
         try:
             analyzer = InvestmentAnalyzer(ticker, verbose=True, model_name=model)
-            result = analyzer.analyze()
+            if analyzer.ticker in precomputed:
+                # Reused results still get the full-report display and save below
+                print(f"♻️  Reusing existing analysis for {analyzer.ticker}")
+                result = analyzer.results = precomputed[analyzer.ticker]
+            else:
+                result = analyzer.analyze()
             results.append(result)
             
             # Display full reports if requested
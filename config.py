@@ -137,6 +137,7 @@ class Config:
     # Data Fetching Configuration
     PRICE_HISTORY_DAYS = 365
     MAX_NEWS_ARTICLES = 5
+    NEWS_RESULTS_PER_QUERY = 5  # DuckDuckGo results per news query (one call per query)
     NEWS_SEARCH_REGION = "wt-wt"  # Worldwide
     
     # DCF Valuation Configuration
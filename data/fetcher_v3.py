@@ -10,17 +10,141 @@ Key Features:
 - Multi-query news search with deduplication
 - All data formatted for LLM consumption
 """
+import copy
 import yfinance as yf
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from typing import Callable, Dict, List, Tuple
 import pandas as pd
 import numpy as np
 from difflib import SequenceMatcher
+from operator import itemgetter
+
+# Optional: rapidfuzz is much faster than difflib for title similarity
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
 
 from config import Config
 from .financial_calculator import FinancialCalculator
 
 
+# In-process cache of completed fetches, keyed by (ticker, ISO date)
+_FETCH_CACHE: Dict[Tuple[str, str], Dict] = {}
+
+# Look-back window for the recent stock split check
+_SPLIT_LOOKBACK = pd.Timedelta(days=180)
+
+# Topics for the 8 targeted news queries ("<TICKER> <topic>")
+_NEWS_QUERY_TOPICS = (
+    'earnings',
+    'quarterly results',
+    'guidance',
+    'CEO CFO',
+    'acquisition merger',
+    'new product',
+    'competition',
+    'SEC filing'
+)
+
+# Column layout of a collected news article (one row per search result)
+_NEWS_COLUMNS = ['title', 'url', 'date', 'snippet', 'source', 'query']
+
+
+def _safe_div(a, b, scale: float = 1.0):
+    """
+    Element-wise a / b * scale, yielding 0.0 wherever b is not positive
+    
+    Works on scalars and arrays alike; NaN denominators also fall back to 0.0
+    """
+    b = np.asarray(b, dtype=float)
+    positive = b > 0
+    return np.where(positive, np.asarray(a, dtype=float) / np.where(positive, b, 1.0) * scale, 0.0)
+
+
+def _row_means(matrix: np.ndarray) -> np.ndarray:
+    """
+    Mean of each row, skipping NaN years
+    
+    Rows with no usable values (or an empty matrix) average to 0.0
+    """
+    valid = ~np.isnan(matrix)
+    return _safe_div(np.where(valid, matrix, 0.0).sum(axis=1), valid.sum(axis=1))
+
+
+def _to_columns(rows: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Transpose per-year statement dicts into one array per field
+    
+    Keeps the order of `rows` (most recent first); numeric fields become
+    float64 arrays so metrics can be computed column-wise.
+    """
+    if not rows:
+        return {}
+    return {
+        key: np.array([row[key] for row in rows], dtype=None if key == 'year' else float)
+        for key in rows[0]
+    }
+
+
+_get_year = itemgetter('year')
+
+
+def _year_row(stmts: List[Dict]) -> str:
+    """Format the 'Year' header line (plus rule) of a statement table"""
+    return f"{'Year':<12}" + "".join(f"{year:<15}" for year in map(_get_year, stmts)) + "\n" + "-" * 80 + "\n"
+
+
+# (label, field getter) rows of each 5-year statement table in the LLM report
+_INCOME_ROWS = (
+    ('Revenue', itemgetter('revenue')),
+    ('Gross Profit', itemgetter('gross_profit')),
+    ('Op Income', itemgetter('operating_income')),
+    ('Net Income', itemgetter('net_income')),
+    ('R&D', itemgetter('rd_expense'))
+)
+_BALANCE_ROWS = (
+    ('Total Assets', itemgetter('total_assets')),
+    ('Cash', itemgetter('cash')),
+    ('Total Debt', itemgetter('total_debt')),
+    ('Equity', itemgetter('total_equity')),
+    ('Goodwill', itemgetter('goodwill'))
+)
+_CASHFLOW_ROWS = (
+    ('Operating CF', itemgetter('operating_cash_flow')),
+    ('CapEx', itemgetter('capex')),
+    ('Free CF', itemgetter('free_cash_flow')),
+    ('Dividends', itemgetter('dividends_paid')),
+    ('Buybacks', itemgetter('stock_buybacks'))
+)
+
+# (section title, data key, rows) in report order
+_STATEMENT_TABLES = (
+    ('Income Statement', 'income_5y', _INCOME_ROWS),
+    ('Balance Sheet', 'balance_5y', _BALANCE_ROWS),
+    ('Cash Flow', 'cashflow_5y', _CASHFLOW_ROWS)
+)
+
+# Pre-bound formatter for a single "$…B" statement cell
+_fmt_billions = "${:>13,.1f}B".format
+
+
+def _row(label: str, stmts: List[Dict], get: Callable[[Dict], float], scale: float = 1e9) -> str:
+    """Format one statement line: label followed by a $…B cell per year"""
+    values = np.fromiter(map(get, stmts), dtype=np.float64, count=len(stmts)) / scale
+    return f"{label:<12}" + "".join(map(_fmt_billions, values)) + "\n"
+
+
+def _title_similarity(a: str, b: str) -> float:
+    """Similarity ratio (0-1) between two lowercased headlines"""
+    if Levenshtein is not None:
+        return Levenshtein.normalized_similarity(a, b)
+    # autojunk=False: the popularity heuristic skews scores on repetitive headlines
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
 class DataFetcherV3:
     """
     Enhanced data fetcher following investment analysis guide principles:
@@ -35,13 +159,27 @@ class DataFetcherV3:
         self.data = {}
         self.calculator = FinancialCalculator()
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all in-process cached fetch results"""
+        _FETCH_CACHE.clear()
+    
     def fetch_all_data(self) -> Dict:
         """
         Fetch comprehensive 5-year financial data
         
+        Results are cached per (ticker, day) for the lifetime of the process,
+        so repeated fetchers for the same ticker skip the network entirely.
+        
         Returns:
             Dictionary with all financial data, metrics, and news
         """
+        cache_key = (self.ticker, date.today().isoformat())
+        if cache_key in _FETCH_CACHE:
+            print(f"\n📊 [V3.0] Using cached data for {self.ticker}")
+            self.data = copy.copy(_FETCH_CACHE[cache_key])
+            return self.data
+        
         print(f"\n📊 [V3.0] Fetching comprehensive 5-year data for {self.ticker}...")
         
         try:
@@ -60,25 +198,30 @@ class DataFetcherV3:
             print("  ├─ Fetching 5-year cash flows...")
             self.data['cashflow_5y'] = self._get_cash_flow_5y()
             
-            # Calculate comprehensive metrics
-            print("  ├─ Calculating 5-year metrics...")
-            self.data['metrics_5y'] = self._calculate_metrics_5y()
-            
-            # Quality indicators (red flags)
-            print("  ├─ Analyzing quality indicators...")
-            self.data['quality_indicators'] = self._calculate_quality_indicators()
-            
-            # Comprehensive news
-            print("  ├─ Fetching comprehensive news (8 queries)...")
-            self.data['news'] = self._get_comprehensive_news()
-            
-            # Validate data quality (check for stock splits, unreasonable P/E ratios)
-            print("  ├─ Validating data quality...")
-            self._validate_data_quality()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Comprehensive news (network-bound, runs while metrics are computed)
+                print("  ├─ Fetching comprehensive news (8 queries)...")
+                news_future = executor.submit(self._get_comprehensive_news)
+                
+                # Calculate comprehensive metrics
+                print("  ├─ Calculating 5-year metrics...")
+                self.data['metrics_5y'] = self._calculate_metrics_5y()
+                
+                # Quality indicators (red flags)
+                print("  ├─ Analyzing quality indicators...")
+                self.data['quality_indicators'] = self._calculate_quality_indicators()
+                
+                # Validate data quality (check for stock splits, unreasonable P/E ratios)
+                print("  ├─ Validating data quality...")
+                self._validate_data_quality()
+                
+                self.data['news'] = news_future.result()
             
             print(f"✅ [V3.0] Data collection complete for {self.ticker}")
             print(f"    └─ {len(self.data['news'])} news articles collected")
             
+            _FETCH_CACHE[cache_key] = copy.copy(self.data)
+            
             return self.data
             
         except Exception as e:
@@ -107,17 +250,8 @@ class DataFetcherV3:
             # Check for recent stock splits and add warning
             split_warning = None
             try:
-                actions = self.stock.actions
-                if not actions.empty and 'Stock Splits' in actions.columns:
-                    from datetime import timezone
-                    six_months_ago = pd.Timestamp.now(tz=actions.index.tz) - pd.Timedelta(days=180)
-                    recent_splits = actions[actions.index > six_months_ago]
-                    splits = recent_splits[recent_splits['Stock Splits'] > 0]
-                    
-                    if not splits.empty:
-                        for date, row in splits.iterrows():
-                            split_ratio = row['Stock Splits']
-                            split_warning = f"CRITICAL: {split_ratio}:1 stock split on {date.strftime('%Y-%m-%d')}. Use provided trailingPE and trailingEps values - DO NOT calculate EPS manually from historical financials as they may not be split-adjusted."
+                for split_date, split_ratio in self._recent_splits():
+                    split_warning = f"CRITICAL: {split_ratio}:1 stock split on {split_date.strftime('%Y-%m-%d')}. Use provided trailingPE and trailingEps values - DO NOT calculate EPS manually from historical financials as they may not be split-adjusted."
             except:
                 pass
             
@@ -160,6 +294,23 @@ class DataFetcherV3:
             print(f"⚠️  Could not fetch company info: {e}")
             return {}
     
+    @cached_property
+    def _actions(self) -> pd.DataFrame:
+        """Dividends/splits history (fetched once per fetcher)"""
+        return self.stock.actions
+    
+    def _recent_splits(self) -> List[Tuple[pd.Timestamp, float]]:
+        """Return (date, ratio) for each stock split in the last 6 months"""
+        splits_col = self._actions.get('Stock Splits')
+        if splits_col is None or splits_col.empty:
+            return []
+        
+        # Timezone-aware cutoff to compare against the actions index
+        six_months_ago = pd.Timestamp.now(tz=splits_col.index.tz) - _SPLIT_LOOKBACK
+        mask = (splits_col.index > six_months_ago) & (splits_col.to_numpy() > 0)
+        
+        return [(splits_col.index[i], splits_col.iat[i]) for i in np.flatnonzero(mask)]
+    
     def _get_market_data(self) -> Dict:
         """Get current market data"""
         try:
@@ -301,9 +452,9 @@ class DataFetcherV3:
     
     def _calculate_metrics_5y(self) -> Dict:
         """Calculate all derived metrics over 5 years"""
-        income = self.data.get('income_5y', [])
-        balance = self.data.get('balance_5y', [])
-        cashflow = self.data.get('cashflow_5y', [])
+        income = _to_columns(self.data.get('income_5y', []))
+        balance = _to_columns(self.data.get('balance_5y', []))
+        cashflow = _to_columns(self.data.get('cashflow_5y', []))
         
         if not income or not balance or not cashflow:
             return {}
@@ -318,11 +469,12 @@ class DataFetcherV3:
         
         return metrics
     
-    def _calc_growth_rates(self, income: List[Dict], cashflow: List[Dict]) -> Dict:
+    def _calc_growth_rates(self, income: Dict[str, np.ndarray], cashflow: Dict[str, np.ndarray]) -> Dict:
         """Calculate revenue, earnings, and FCF growth rates"""
-        revenues = [stmt['revenue'] for stmt in income if stmt['revenue'] > 0]
-        earnings = [stmt['net_income'] for stmt in income if stmt['net_income'] != 0]
-        fcfs = [cf['free_cash_flow'] for cf in cashflow if cf['free_cash_flow'] != 0]
+        revenue, net_income, fcf = income['revenue'], income['net_income'], cashflow['free_cash_flow']
+        revenues = revenue[revenue > 0].tolist()
+        earnings = net_income[net_income != 0].tolist()
+        fcfs = fcf[fcf != 0].tolist()
         
         return {
             'revenue_cagr': self.calculator.calculate_cagr(revenues),
@@ -333,95 +485,119 @@ class DataFetcherV3:
             'fcf_trend': fcfs[::-1]
         }
     
-    def _calc_profitability(self, income: List[Dict]) -> Dict:
+    def _calc_profitability(self, income: Dict[str, np.ndarray]) -> Dict:
         """Calculate margin trends"""
-        margins = []
-        for stmt in income:
-            if stmt['revenue'] > 0:
-                margins.append({
-                    'year': stmt['year'],
-                    'gross_margin': (stmt['gross_profit'] / stmt['revenue'] * 100) if stmt['revenue'] else 0,
-                    'operating_margin': (stmt['operating_income'] / stmt['revenue'] * 100) if stmt['revenue'] else 0,
-                    'net_margin': (stmt['net_income'] / stmt['revenue'] * 100) if stmt['revenue'] else 0
-                })
+        has_revenue = income['revenue'] > 0
+        
+        # Rows: gross, operating, net margin; columns: years with revenue
+        margin_matrix = _safe_div(
+            np.vstack((income['gross_profit'], income['operating_income'], income['net_income']))[:, has_revenue],
+            income['revenue'][has_revenue],
+            100
+        )
+        gross_margin, operating_margin, net_margin = margin_matrix
+        avg_gross, avg_operating, avg_net = _row_means(margin_matrix)
+        
+        margins = [
+            {
+                'year': year,
+                'gross_margin': float(gross),
+                'operating_margin': float(operating),
+                'net_margin': float(net)
+            }
+            for year, gross, operating, net in zip(
+                income['year'][has_revenue].tolist(), gross_margin, operating_margin, net_margin
+            )
+        ]
         
         return {
             'margins_by_year': margins,
-            'avg_gross_margin': np.mean([m['gross_margin'] for m in margins]) if margins else 0,
-            'avg_operating_margin': np.mean([m['operating_margin'] for m in margins]) if margins else 0,
-            'avg_net_margin': np.mean([m['net_margin'] for m in margins]) if margins else 0
+            'avg_gross_margin': float(avg_gross),
+            'avg_operating_margin': float(avg_operating),
+            'avg_net_margin': float(avg_net)
         }
     
-    def _calc_returns(self, income: List[Dict], balance: List[Dict]) -> Dict:
+    def _calc_returns(self, income: Dict[str, np.ndarray], balance: Dict[str, np.ndarray]) -> Dict:
         """Calculate ROE, ROA, ROIC"""
-        returns = []
+        n = min(len(income['year']), len(balance['year']))
+        net_income = income['net_income'][:n]
+        total_assets = balance['total_assets'][:n]
         
-        for i in range(min(len(income), len(balance))):
-            inc = income[i]
-            bal = balance[i]
-            
-            roe = (inc['net_income'] / bal['total_equity'] * 100) if bal['total_equity'] > 0 else 0
-            roa = (inc['net_income'] / bal['total_assets'] * 100) if bal['total_assets'] > 0 else 0
-            
-            # ROIC = NOPAT / Invested Capital
-            # NOPAT = Operating Income × (1 - Tax Rate)
-            # Simplified: use operating income
-            # Invested Capital = Total Assets - Current Liabilities
-            invested_capital = bal['total_assets'] - bal['current_liabilities']
-            roic = (inc['operating_income'] / invested_capital * 100) if invested_capital > 0 else 0
-            
-            returns.append({
-                'year': inc['year'],
-                'roe': roe,
-                'roa': roa,
-                'roic': roic
-            })
+        # ROIC = NOPAT / Invested Capital
+        # NOPAT = Operating Income × (1 - Tax Rate)
+        # Simplified: use operating income
+        # Invested Capital = Total Assets - Current Liabilities
+        invested_capital = total_assets - balance['current_liabilities'][:n]
+        
+        # Rows: ROE, ROA, ROIC
+        returns_matrix = _safe_div(
+            np.vstack((net_income, net_income, income['operating_income'][:n])),
+            np.vstack((balance['total_equity'][:n], total_assets, invested_capital)),
+            100
+        )
+        roe, roa, roic = returns_matrix
+        avg_roe, avg_roa, avg_roic = _row_means(returns_matrix)
+        
+        returns = [
+            {
+                'year': year,
+                'roe': float(e),
+                'roa': float(a),
+                'roic': float(ic)
+            }
+            for year, e, a, ic in zip(income['year'][:n].tolist(), roe, roa, roic)
+        ]
         
         return {
             'returns_by_year': returns,
-            'avg_roe': np.mean([r['roe'] for r in returns]) if returns else 0,
-            'avg_roa': np.mean([r['roa'] for r in returns]) if returns else 0,
-            'avg_roic': np.mean([r['roic'] for r in returns]) if returns else 0
+            'avg_roe': float(avg_roe),
+            'avg_roa': float(avg_roa),
+            'avg_roic': float(avg_roic)
         }
     
-    def _calc_leverage(self, balance: List[Dict]) -> Dict:
+    def _calc_leverage(self, balance: Dict[str, np.ndarray]) -> Dict:
         """Calculate debt ratios"""
-        leverage = []
+        # Rows: debt/equity, current ratio
+        leverage_matrix = _safe_div(
+            np.vstack((balance['total_debt'], balance['current_assets'])),
+            np.vstack((balance['total_equity'], balance['current_liabilities']))
+        )
+        debt_to_equity, current_ratio = leverage_matrix
+        avg_debt_to_equity, avg_current_ratio = _row_means(leverage_matrix)
         
-        for bal in balance:
-            debt_to_equity = (bal['total_debt'] / bal['total_equity']) if bal['total_equity'] > 0 else 0
-            current_ratio = (bal['current_assets'] / bal['current_liabilities']) if bal['current_liabilities'] > 0 else 0
-            
-            leverage.append({
-                'year': bal['year'],
-                'debt_to_equity': debt_to_equity,
-                'current_ratio': current_ratio
-            })
+        leverage = [
+            {
+                'year': year,
+                'debt_to_equity': float(de),
+                'current_ratio': float(cr)
+            }
+            for year, de, cr in zip(balance['year'].tolist(), debt_to_equity, current_ratio)
+        ]
         
         return {
             'leverage_by_year': leverage,
-            'avg_debt_to_equity': np.mean([l['debt_to_equity'] for l in leverage]) if leverage else 0,
-            'avg_current_ratio': np.mean([l['current_ratio'] for l in leverage]) if leverage else 0
+            'avg_debt_to_equity': float(avg_debt_to_equity),
+            'avg_current_ratio': float(avg_current_ratio)
         }
     
-    def _calc_efficiency(self, income: List[Dict], balance: List[Dict]) -> Dict:
+    def _calc_efficiency(self, income: Dict[str, np.ndarray], balance: Dict[str, np.ndarray]) -> Dict:
         """Calculate asset turnover, inventory turnover, DSO"""
-        efficiency = []
+        n = min(len(income['year']), len(balance['year']))
+        revenue = income['revenue'][:n]
         
-        for i in range(min(len(income), len(balance))):
-            inc = income[i]
-            bal = balance[i]
-            
-            asset_turnover = (inc['revenue'] / bal['total_assets']) if bal['total_assets'] > 0 else 0
-            inventory_turnover = (inc['cost_of_revenue'] / bal['inventory']) if bal['inventory'] > 0 else 0
-            dso = (bal['accounts_receivable'] / inc['revenue'] * 365) if inc['revenue'] > 0 else 0
-            
-            efficiency.append({
-                'year': inc['year'],
-                'asset_turnover': asset_turnover,
-                'inventory_turnover': inventory_turnover,
-                'days_sales_outstanding': dso
-            })
+        asset_turnover = _safe_div(revenue, balance['total_assets'][:n])
+        inventory_turnover = _safe_div(income['cost_of_revenue'][:n], balance['inventory'][:n])
+        dso = _safe_div(balance['accounts_receivable'][:n], revenue, 365)
+        
+        efficiency = [
+            {
+                'year': year,
+                'asset_turnover': float(at),
+                'inventory_turnover': float(it),
+                'days_sales_outstanding': float(d)
+            }
+            for year, at, it, d in zip(income['year'][:n].tolist(), asset_turnover, inventory_turnover, dso)
+        ]
         
         return {
             'efficiency_by_year': efficiency
@@ -436,19 +612,23 @@ class DataFetcherV3:
         Calculate quality indicators and red flags
         Following the investment guide's red flag detection
         """
-        income = self.data.get('income_5y', [])
-        balance = self.data.get('balance_5y', [])
-        cashflow = self.data.get('cashflow_5y', [])
+        income = _to_columns(self.data.get('income_5y', []))
+        balance = _to_columns(self.data.get('balance_5y', []))
+        cashflow = _to_columns(self.data.get('cashflow_5y', []))
         
         if not income or not balance or not cashflow:
             return {}
         
+        revenue = income['revenue']
+        receivables = balance['accounts_receivable']
+        inventory = balance['inventory']
+        
         red_flags = []
         
         # 1. Receivables growth vs Revenue growth (Revenue Quality)
-        if len(income) >= 2 and len(balance) >= 2:
-            revenue_growth = (income[0]['revenue'] - income[1]['revenue']) / income[1]['revenue'] if income[1]['revenue'] > 0 else 0
-            ar_growth = (balance[0]['accounts_receivable'] - balance[1]['accounts_receivable']) / balance[1]['accounts_receivable'] if balance[1]['accounts_receivable'] > 0 else 0
+        if len(revenue) >= 2 and len(receivables) >= 2:
+            revenue_growth = float(_safe_div(revenue[0] - revenue[1], revenue[1]))
+            ar_growth = float(_safe_div(receivables[0] - receivables[1], receivables[1]))
             
             if ar_growth > revenue_growth and ar_growth > 0.05:  # AR growing faster by >5%
                 red_flags.append({
@@ -460,10 +640,10 @@ class DataFetcherV3:
         
         # 2. FCF vs Net Income (Profit Quality)
         if cashflow and income:
-            fcf = cashflow[0]['free_cash_flow']
-            ni = income[0]['net_income']
+            fcf = cashflow['free_cash_flow'][0]
+            ni = income['net_income'][0]
             
-            fcf_to_ni_ratio = (fcf / ni) if ni > 0 else 0
+            fcf_to_ni_ratio = float(_safe_div(fcf, ni))
             
             if fcf < ni * 0.8 and ni > 0:  # FCF < 80% of Net Income
                 red_flags.append({
@@ -474,9 +654,9 @@ class DataFetcherV3:
                 })
         
         # 3. Inventory buildup
-        if len(income) >= 2 and len(balance) >= 2:
-            revenue_growth = (income[0]['revenue'] - income[1]['revenue']) / income[1]['revenue'] if income[1]['revenue'] > 0 else 0
-            inventory_growth = (balance[0]['inventory'] - balance[1]['inventory']) / balance[1]['inventory'] if balance[1]['inventory'] > 0 else 0
+        if len(revenue) >= 2 and len(inventory) >= 2:
+            revenue_growth = float(_safe_div(revenue[0] - revenue[1], revenue[1]))
+            inventory_growth = float(_safe_div(inventory[0] - inventory[1], inventory[1]))
             
             if inventory_growth > revenue_growth and inventory_growth > 0.10:  # Inventory growing faster by >10%
                 red_flags.append({
@@ -488,7 +668,7 @@ class DataFetcherV3:
         
         # 4. Goodwill as % of assets
         if balance:
-            goodwill_pct = (balance[0]['goodwill'] / balance[0]['total_assets'] * 100) if balance[0]['total_assets'] > 0 else 0
+            goodwill_pct = float(_safe_div(balance['goodwill'][0], balance['total_assets'][0], 100))
             
             if goodwill_pct > 30:
                 red_flags.append({
@@ -500,8 +680,8 @@ class DataFetcherV3:
         
         # 5. Debt service coverage
         if income and balance:
-            interest = income[0]['interest_expense']
-            ebit = income[0]['operating_income']
+            interest = income['interest_expense'][0]
+            ebit = income['operating_income'][0]
             
             interest_coverage = (ebit / interest) if interest > 0 else float('inf')
             
@@ -515,7 +695,7 @@ class DataFetcherV3:
         
         # 6. Current ratio < 1 (Liquidity risk)
         if balance:
-            current_ratio = (balance[0]['current_assets'] / balance[0]['current_liabilities']) if balance[0]['current_liabilities'] > 0 else 0
+            current_ratio = float(_safe_div(balance['current_assets'][0], balance['current_liabilities'][0]))
             
             if current_ratio < 1:
                 red_flags.append({
@@ -546,38 +726,36 @@ class DataFetcherV3:
             from ddgs import DDGS
             
             # 8 targeted search queries
-            queries = [
-                f"{self.ticker} earnings",
-                f"{self.ticker} quarterly results",
-                f"{self.ticker} guidance",
-                f"{self.ticker} CEO CFO",
-                f"{self.ticker} acquisition merger",
-                f"{self.ticker} new product",
-                f"{self.ticker} competition",
-                f"{self.ticker} SEC filing"
-            ]
-            
-            all_news = []
-            ddgs = DDGS()
+            queries = [f"{self.ticker} {topic}" for topic in _NEWS_QUERY_TOPICS]
+            
+            rows = []
+            search_news = DDGS().news
+            max_results = Config.NEWS_RESULTS_PER_QUERY
             
             for query in queries:
                 try:
-                    results = ddgs.news(query, max_results=5, timelimit='3m')  # Last 3 months
+                    results = search_news(query, max_results=max_results, timelimit='3m')  # Last 3 months
                     
                     for article in results:
-                        all_news.append({
-                            'title': article.get('title', ''),
-                            'url': article.get('url', ''),
-                            'date': article.get('date', ''),
-                            'snippet': article.get('body', ''),
-                            'source': article.get('source', ''),
-                            'query': query
-                        })
+                        rows.append((
+                            article.get('title', ''),
+                            article.get('url', ''),
+                            article.get('date', ''),
+                            article.get('body', ''),
+                            article.get('source', ''),
+                            query
+                        ))
                     
                 except Exception as e:
                     print(f"  ⚠️  Query '{query}' failed: {e}")
                     continue
             
+            # Drop exact title repeats in one table op, then convert to records
+            news_df = pd.DataFrame(rows, columns=_NEWS_COLUMNS)
+            news_df['title_norm'] = news_df['title'].str.lower().str.strip()
+            news_df = news_df.drop_duplicates(subset='title_norm')
+            all_news = news_df[_NEWS_COLUMNS].to_dict('records')
+            
             # Deduplicate by title similarity
             deduplicated = self._deduplicate_news(all_news)
             
@@ -601,7 +779,7 @@ class DataFetcherV3:
             
             # Check similarity with existing titles
             for seen in seen_titles:
-                similarity = SequenceMatcher(None, title, seen).ratio()
+                similarity = _title_similarity(title, seen)
                 if similarity > 0.8:  # 80% similar = duplicate
                     is_duplicate = True
                     break
@@ -624,200 +802,89 @@ class DataFetcherV3:
         if not self.data:
             self.fetch_all_data()
         
-        output = f"""
+        parts = [f"""
 {'='*80}
 COMPREHENSIVE FINANCIAL DATA - {self.ticker}
 DATA COLLECTION VERSION 3.0
 {'='*80}
 
-"""
+"""]
         
         # Company Info
-        output += self._format_company_info()
+        parts.append(self._format_company_info())
         
         # Market Data
-        output += self._format_market_data()
+        parts.append(self._format_market_data())
         
         # 5-Year Financial Statements
-        output += self._format_financial_statements_5y()
+        parts.append(self._format_financial_statements_5y())
         
         # 5-Year Metrics & Trends
-        output += self._format_metrics_5y()
+        parts.append(self._format_metrics_5y())
         
         # Quality Indicators (Red Flags)
-        output += self._format_quality_indicators()
+        parts.append(self._format_quality_indicators())
         
         # News
-        output += self._format_news()
+        parts.append(self._format_news())
         
-        return output
+        return "".join(parts)
     
     def _format_company_info(self) -> str:
         """Format company information"""
-        info = self.data.get('company_info', {})
+        # Bound .get: one attribute lookup for the whole template
+        info = self.data.get('company_info', {}).get
         
         return f"""
 ## COMPANY OVERVIEW
 {'-'*80}
-Name:        {info.get('name', 'N/A')}
+Name:        {info('name', 'N/A')}
 Ticker:      {self.ticker}
-Sector:      {info.get('sector', 'N/A')}
-Industry:    {info.get('industry', 'N/A')}
-Employees:   {info.get('employees', 0):,}
-Location:    {info.get('city', 'N/A')}, {info.get('country', 'N/A')}
+Sector:      {info('sector', 'N/A')}
+Industry:    {info('industry', 'N/A')}
+Employees:   {info('employees', 0):,}
+Location:    {info('city', 'N/A')}, {info('country', 'N/A')}
 
 Description:
-{info.get('description', 'N/A')}
+{info('description', 'N/A')}
 
 """
     
     def _format_market_data(self) -> str:
         """Format current market data"""
-        market = self.data.get('market_data', {})
+        market = self.data.get('market_data', {}).get
         
         return f"""
 ## CURRENT MARKET DATA
 {'-'*80}
-Current Price:       ${market.get('current_price', 0):.2f}
-Market Cap:          ${market.get('market_cap', 0):,.0f}
-Shares Outstanding:  {market.get('shares_outstanding', 0):,.0f}
-Beta:                {market.get('beta', 1.0):.2f}
-52-Week High:        ${market.get('52_week_high', 0):.2f}
-52-Week Low:         ${market.get('52_week_low', 0):.2f}
-YTD Return:          {market.get('ytd_return', 0):.2f}%
+Current Price:       ${market('current_price', 0):.2f}
+Market Cap:          ${market('market_cap', 0):,.0f}
+Shares Outstanding:  {market('shares_outstanding', 0):,.0f}
+Beta:                {market('beta', 1.0):.2f}
+52-Week High:        ${market('52_week_high', 0):.2f}
+52-Week Low:         ${market('52_week_low', 0):.2f}
+YTD Return:          {market('ytd_return', 0):.2f}%
 
 """
     
     def _format_financial_statements_5y(self) -> str:
         """Format 5-year financial statements"""
-        income = self.data.get('income_5y', [])
-        balance = self.data.get('balance_5y', [])
-        cashflow = self.data.get('cashflow_5y', [])
-        
-        output = f"""
+        parts = [f"""
 ## FINANCIAL STATEMENTS (5-YEAR HISTORY)
 {'-'*80}
-
-### Income Statement (Annual, Most Recent First)
-"""
+"""]
         
-        # Income statement table
-        if income:
-            output += "\n"
-            output += f"{'Year':<12}"
-            for stmt in income[:5]:
-                output += f"{stmt['year']:<15}"
-            output += "\n" + "-" * 80 + "\n"
-            
-            # Revenues
-            output += f"{'Revenue':<12}"
-            for stmt in income[:5]:
-                output += f"${stmt['revenue']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Gross Profit
-            output += f"{'Gross Profit':<12}"
-            for stmt in income[:5]:
-                output += f"${stmt['gross_profit']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Operating Income
-            output += f"{'Op Income':<12}"
-            for stmt in income[:5]:
-                output += f"${stmt['operating_income']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Net Income
-            output += f"{'Net Income':<12}"
-            for stmt in income[:5]:
-                output += f"${stmt['net_income']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # R&D
-            output += f"{'R&D':<12}"
-            for stmt in income[:5]:
-                output += f"${stmt['rd_expense']/1e9:>13,.1f}B"
-            output += "\n"
-        
-        output += "\n### Balance Sheet (Annual, Most Recent First)\n"
+        for title, data_key, rows in _STATEMENT_TABLES:
+            stmts = self.data.get(data_key, [])[:5]
+            parts.append(f"\n### {title} (Annual, Most Recent First)\n")
+            
+            if stmts:
+                parts.append("\n")
+                parts.append(_year_row(stmts))
+                parts.extend(_row(label, stmts, get) for label, get in rows)
         
-        if balance:
-            output += "\n"
-            output += f"{'Year':<12}"
-            for stmt in balance[:5]:
-                output += f"{stmt['year']:<15}"
-            output += "\n" + "-" * 80 + "\n"
-            
-            # Total Assets
-            output += f"{'Total Assets':<12}"
-            for stmt in balance[:5]:
-                output += f"${stmt['total_assets']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Cash
-            output += f"{'Cash':<12}"
-            for stmt in balance[:5]:
-                output += f"${stmt['cash']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Total Debt
-            output += f"{'Total Debt':<12}"
-            for stmt in balance[:5]:
-                output += f"${stmt['total_debt']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Equity
-            output += f"{'Equity':<12}"
-            for stmt in balance[:5]:
-                output += f"${stmt['total_equity']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Goodwill
-            output += f"{'Goodwill':<12}"
-            for stmt in balance[:5]:
-                output += f"${stmt['goodwill']/1e9:>13,.1f}B"
-            output += "\n"
-        
-        output += "\n### Cash Flow (Annual, Most Recent First)\n"
-        
-        if cashflow:
-            output += "\n"
-            output += f"{'Year':<12}"
-            for stmt in cashflow[:5]:
-                output += f"{stmt['year']:<15}"
-            output += "\n" + "-" * 80 + "\n"
-            
-            # Operating CF
-            output += f"{'Operating CF':<12}"
-            for stmt in cashflow[:5]:
-                output += f"${stmt['operating_cash_flow']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # CapEx
-            output += f"{'CapEx':<12}"
-            for stmt in cashflow[:5]:
-                output += f"${stmt['capex']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Free Cash Flow
-            output += f"{'Free CF':<12}"
-            for stmt in cashflow[:5]:
-                output += f"${stmt['free_cash_flow']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Dividends
-            output += f"{'Dividends':<12}"
-            for stmt in cashflow[:5]:
-                output += f"${stmt['dividends_paid']/1e9:>13,.1f}B"
-            output += "\n"
-            
-            # Buybacks
-            output += f"{'Buybacks':<12}"
-            for stmt in cashflow[:5]:
-                output += f"${stmt['stock_buybacks']/1e9:>13,.1f}B"
-            output += "\n"
-        
-        return output + "\n"
+        parts.append("\n")
+        return "".join(parts)
     
     def _format_metrics_5y(self) -> str:
         """Format 5-year metrics and trends"""
@@ -826,31 +893,31 @@ YTD Return:          {market.get('ytd_return', 0):.2f}%
         if not metrics:
             return "\n## METRICS NOT AVAILABLE\n\n"
         
-        growth = metrics.get('growth_rates', {})
-        profit = metrics.get('profitability', {})
-        returns = metrics.get('returns', {})
+        # Bind each section's .get once for the template below
+        growth = (metrics.get('growth_rates') or {}).get
+        profit = (metrics.get('profitability') or {}).get
+        returns = (metrics.get('returns') or {}).get
         
-        output = f"""
+        return f"""
 ## KEY METRICS & TRENDS (5-YEAR)
 {'-'*80}
 
 ### Growth Rates (CAGR)
-Revenue:         {growth.get('revenue_cagr', 0)*100:>6.1f}%
-Earnings:        {growth.get('earnings_cagr', 0)*100:>6.1f}%
-Free Cash Flow:  {growth.get('fcf_cagr', 0)*100:>6.1f}%
+Revenue:         {growth('revenue_cagr', 0)*100:>6.1f}%
+Earnings:        {growth('earnings_cagr', 0)*100:>6.1f}%
+Free Cash Flow:  {growth('fcf_cagr', 0)*100:>6.1f}%
 
 ### Profitability (5-Year Average)
-Gross Margin:      {profit.get('avg_gross_margin', 0):>6.1f}%
-Operating Margin:  {profit.get('avg_operating_margin', 0):>6.1f}%
-Net Margin:        {profit.get('avg_net_margin', 0):>6.1f}%
+Gross Margin:      {profit('avg_gross_margin', 0):>6.1f}%
+Operating Margin:  {profit('avg_operating_margin', 0):>6.1f}%
+Net Margin:        {profit('avg_net_margin', 0):>6.1f}%
 
 ### Returns (5-Year Average)
-ROE:   {returns.get('avg_roe', 0):>6.1f}%
-ROA:   {returns.get('avg_roa', 0):>6.1f}%
-ROIC:  {returns.get('avg_roic', 0):>6.1f}%
+ROE:   {returns('avg_roe', 0):>6.1f}%
+ROA:   {returns('avg_roa', 0):>6.1f}%
+ROIC:  {returns('avg_roic', 0):>6.1f}%
 
 """
-        return output
     
     def _format_quality_indicators(self) -> str:
         """Format quality indicators and red flags"""
@@ -859,33 +926,34 @@ ROIC:  {returns.get('avg_roic', 0):>6.1f}%
         if not quality:
             return "\n## QUALITY INDICATORS NOT AVAILABLE\n\n"
         
-        red_flags = quality.get('red_flags', [])
+        quality_get = quality.get
+        red_flags = quality_get('red_flags', [])
         
-        output = f"""
+        parts = [f"""
 ## QUALITY INDICATORS & RED FLAGS
 {'-'*80}
 
-Red Flags Detected: {quality.get('red_flag_count', 0)}
+Red Flags Detected: {quality_get('red_flag_count', 0)}
 
-"""
+"""]
         
         if red_flags:
             for flag in red_flags:
-                output += f"""
+                parts.append(f"""
 [{flag['severity']}] {flag['category']}: {flag['flag']}
     → {flag['detail']}
-"""
+""")
         else:
-            output += "✅ No significant red flags detected\n"
+            parts.append("✅ No significant red flags detected\n")
         
-        output += f"""
+        parts.append(f"""
 Key Quality Metrics:
-- FCF/Net Income Ratio:  {quality.get('fcf_to_ni_ratio', 0):.2f} (should be > 0.8)
-- Goodwill % of Assets:  {quality.get('goodwill_pct', 0):.1f}% (threshold: 30%)
-- Interest Coverage:     {quality.get('interest_coverage', 0):.1f}x (should be > 3x)
+- FCF/Net Income Ratio:  {quality_get('fcf_to_ni_ratio', 0):.2f} (should be > 0.8)
+- Goodwill % of Assets:  {quality_get('goodwill_pct', 0):.1f}% (threshold: 30%)
+- Interest Coverage:     {quality_get('interest_coverage', 0):.1f}x (should be > 3x)
 
-"""
-        return output
+""")
+        return "".join(parts)
     
     def _format_news(self) -> str:
         """Format news articles"""
@@ -894,22 +962,16 @@ Key Quality Metrics:
         if not news:
             return "\n## NO NEWS AVAILABLE\n\n"
         
-        output = f"""
-## RECENT NEWS & EVENTS ({len(news)} articles)
-{'-'*80}
-
-"""
-        
-        for i, article in enumerate(news[:30], 1):  # Show max 30
-            output += f"""
-[{i}] {article['title']}
-    Date: {article['date']}
-    Source: {article['source']}
-    {article['snippet'][:200]}...
-    
-"""
+        body = "\n".join(
+            f"[{i}] {article['title']}\n"
+            f"    Date: {article['date']}\n"
+            f"    Source: {article['source']}\n"
+            f"    {article['snippet'][:200]}...\n"
+            f"    \n"
+            for i, article in enumerate(news[:30], 1)  # Show max 30
+        )
         
-        return output
+        return f"\n## RECENT NEWS & EVENTS ({len(news)} articles)\n{'-'*80}\n\n\n{body}"
     
     def _validate_data_quality(self) -> None:
         """
@@ -925,20 +987,9 @@ Key Quality Metrics:
             
             # Check for recent stock splits (last 6 months)
             try:
-                actions = self.stock.actions
-                if not actions.empty and 'Stock Splits' in actions.columns:
-                    # Get timezone-aware datetime for comparison
-                    from datetime import timezone
-                    six_months_ago = pd.Timestamp.now(tz=actions.index.tz) - pd.Timedelta(days=180)
-                    
-                    recent_splits = actions[actions.index > six_months_ago]
-                    splits = recent_splits[recent_splits['Stock Splits'] > 0]
-                    
-                    if not splits.empty:
-                        for date, row in splits.iterrows():
-                            split_ratio = row['Stock Splits']
-                            print(f"    ⚠️  WARNING: Recent {split_ratio}:1 stock split on {date.strftime('%Y-%m-%d')}")
-                            print(f"    └─ Historical financials may need manual adjustment")
+                for split_date, split_ratio in self._recent_splits():
+                    print(f"    ⚠️  WARNING: Recent {split_ratio}:1 stock split on {split_date.strftime('%Y-%m-%d')}")
+                    print(f"    └─ Historical financials may need manual adjustment")
             except Exception as e:
                 # Silently continue if we can't check splits
                 pass
@@ -3,9 +3,48 @@ Financial Calculator Module
 Calculates derived financial metrics
 """
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import pandas as pd
 
+from utils.jit import njit
+
+
+@njit('float64(float64[::1])', cache=True)
+def _cagr_kernel(values: np.ndarray) -> float:
+    """CAGR over non-zero, non-NaN values (most recent first)"""
+    end_value = 0.0
+    start_value = 0.0
+    n_clean = 0
+    
+    # Filter out zeros and NaN, but keep negatives
+    for v in values:
+        if v != 0.0 and not np.isnan(v):
+            if n_clean == 0:
+                end_value = v  # Most recent
+            start_value = v    # Oldest (list is reversed)
+            n_clean += 1
+    
+    if n_clean < 2:
+        return 0.0
+    
+    num_periods = n_clean - 1
+    
+    # Handle different scenarios
+    if start_value > 0:
+        # Normal CAGR: (End/Start)^(1/n) - 1
+        cagr = ((end_value / start_value) ** (1 / num_periods)) - 1
+    elif start_value < 0 and end_value > 0:
+        # Negative to positive turnaround
+        cagr = min(((end_value - start_value) / abs(start_value)) / num_periods, 2.0)
+    elif start_value < 0 and end_value < 0:
+        # Both negative
+        cagr = -((abs(start_value) / abs(end_value)) ** (1 / num_periods) - 1)
+    else:
+        cagr = 0.0
+    
+    # Cap at reasonable bounds (-100% to +200%)
+    return max(min(cagr, 2.0), -1.0)
+
 
 class FinancialCalculator:
     """Calculates derived financial metrics and ratios"""
@@ -21,19 +60,17 @@ class FinancialCalculator:
         Returns:
             List of FCF values (most recent first)
         """
-        fcf_history = []
+        num_years = min(4, len(cash_flow.columns))
         
-        for i in range(min(4, len(cash_flow.columns))):
-            col = cash_flow.iloc[:, i]
-            
-            operating_cf = col.get('Operating Cash Flow', 0)
-            capex = col.get('Capital Expenditure', 0)
-            
-            # Calculate FCF (CapEx is usually negative)
-            fcf = operating_cf - abs(capex)
-            fcf_history.append(fcf)
+        def row(label: str) -> np.ndarray:
+            if label not in cash_flow.index:
+                return np.zeros(num_years)
+            return cash_flow.loc[label].to_numpy(dtype=float)[:num_years]
         
-        return fcf_history
+        # Calculate FCF (CapEx is usually negative)
+        fcf = row('Operating Cash Flow') - np.abs(row('Capital Expenditure'))
+        
+        return fcf.tolist()
     
     @staticmethod
     def calculate_cagr(values: List[float]) -> float:
@@ -47,34 +84,7 @@ class FinancialCalculator:
         Returns:
             CAGR as decimal (e.g., 0.15 for 15%)
         """
-        # Filter out zeros and NaN, but keep negatives
-        clean_values = [
-            v for v in values 
-            if v != 0 and not (isinstance(v, float) and np.isnan(v))
-        ]
-        
-        if len(clean_values) < 2:
-            return 0
-        
-        start_value = clean_values[-1]  # Oldest (list is reversed)
-        end_value = clean_values[0]     # Most recent
-        num_periods = len(clean_values) - 1
-        
-        # Handle different scenarios
-        if start_value > 0:
-            # Normal CAGR: (End/Start)^(1/n) - 1
-            cagr = ((end_value / start_value) ** (1 / num_periods)) - 1
-        elif start_value < 0 and end_value > 0:
-            # Negative to positive turnaround
-            cagr = min(((end_value - start_value) / abs(start_value)) / num_periods, 2.0)
-        elif start_value < 0 and end_value < 0:
-            # Both negative
-            cagr = -((abs(start_value) / abs(end_value)) ** (1 / num_periods) - 1)
-        else:
-            cagr = 0
-        
-        # Cap at reasonable bounds (-100% to +200%)
-        return max(min(cagr, 2.0), -1.0)
+        return _cagr_kernel(np.ascontiguousarray(values, dtype=np.float64))
     
     @staticmethod
     def calculate_revenue_growth(income_stmt: pd.DataFrame) -> float:
@@ -99,7 +109,7 @@ class FinancialCalculator:
         return 0
     
     @staticmethod
-    def calculate_peg_ratio(pe_ratio: float, revenue_growth: float) -> str:
+    def calculate_peg_ratio(pe_ratio: float, revenue_growth: float) -> Optional[float]:
         """
         Calculate PEG ratio
         
@@ -108,14 +118,14 @@ class FinancialCalculator:
             revenue_growth: Revenue growth as decimal
             
         Returns:
-            PEG ratio as formatted string or 'N/A'
+            PEG ratio, or None if it cannot be calculated
+            (callers format it, e.g. "N/A" for None)
         """
         if isinstance(pe_ratio, (int, float)) and pe_ratio > 0 and revenue_growth > 0:
             growth_percent = revenue_growth * 100
-            peg = pe_ratio / growth_percent
-            return f"{peg:.2f}"
+            return pe_ratio / growth_percent
         
-        return "N/A"
+        return None
     
     @staticmethod
     def calculate_margins(revenue: float, **kwargs) -> Dict[str, float]:
@@ -4,21 +4,100 @@ Review and analyze historical investment decisions
 """
 import argparse
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Iterable
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from utils.performance_tracker import PerformanceTracker
 
+# Line templates for the all-decisions review table
+# (model and recommendation are truncated to 23/8 chars via format precision)
+REVIEW_ROW_FMT = "{:<12} {:<8} {:<25.23} {:<10.8} {:<6} {:<10} {:<10} {:<10} {:<10}\n"
+REVIEW_RULE = "-" * 120 + "\n"
+REVIEW_BANNER = "=" * 120 + "\n"
+
+
+# Successful price lookups keyed by (ticker, day); failures are not cached so
+# a transient error is retried on the next call
+_PRICE_CACHE: Dict[tuple, float] = {}
+
 
 def get_current_price(ticker: str) -> float:
-    """Get current price for a ticker"""
+    """Get current price for a ticker (memoized per day within the process)"""
+    key = (ticker, date.today().isoformat())
+    price = _PRICE_CACHE.get(key)
+    if price is None:
+        price = _fetch_price(ticker)
+        if price is not None:
+            _PRICE_CACHE[key] = price
+    return price
+
+
+def _fetch_price(ticker: str) -> float:
+    """Fetch the current price for a ticker (None if unavailable)"""
     try:
         stock = yf.Ticker(ticker)
-        return stock.info.get('currentPrice', stock.history(period='1d')['Close'].iloc[-1])
-    except:
+        
+        # Fast path: lightweight quote endpoint
+        try:
+            return float(stock.fast_info['last_price'])
+        except Exception:
+            pass
+        
+        info = stock.info
+        if info.get('currentPrice'):
+            return float(info['currentPrice'])
+        
+        # Only download history when the quote fields are missing
+        return float(stock.history(period='1d')['Close'].iloc[-1])
+    except Exception:
         return None
 
 
+def get_current_prices(tickers: Iterable[str]) -> Dict[str, float]:
+    """
+    Get current prices for many tickers with a single batched download
+    
+    Args:
+        tickers: Ticker symbols (duplicates are fine)
+    
+    Returns:
+        Dictionary mapping ticker to last close (None if unavailable)
+    """
+    unique = sorted(set(tickers))
+    if not unique:
+        return {}
+    
+    # Serve today's cached prices; batch-download the rest and cache the hits
+    # so later get_current_price calls in the same day do not refetch them
+    day = date.today().isoformat()
+    prices = {ticker: _PRICE_CACHE[(ticker, day)] for ticker in unique if (ticker, day) in _PRICE_CACHE}
+    to_download = [ticker for ticker in unique if ticker not in prices]
+    try:
+        if to_download:
+            closes = yf.download(to_download, period='5d', threads=True, progress=False)['Close']
+            if isinstance(closes, pd.Series):
+                closes = closes.to_frame(to_download[0])
+            
+            for ticker in to_download:
+                if ticker in closes.columns:
+                    col = closes[ticker].dropna()
+                    if not col.empty:
+                        prices[ticker] = _PRICE_CACHE[(ticker, day)] = float(col.iloc[-1])
+    except Exception:
+        pass
+    
+    # Fall back to per-ticker lookups (concurrently) for anything the batch missed
+    missing = [ticker for ticker in unique if ticker not in prices]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+            prices.update(zip(missing, executor.map(get_current_price, missing)))
+    
+    return prices
+
+
 def calculate_return(initial_price: float, current_price: float) -> float:
     """Calculate return percentage"""
     if initial_price and current_price:
@@ -26,6 +105,11 @@ def calculate_return(initial_price: float, current_price: float) -> float:
     return None
 
 
+def _compute_returns(initial: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Vectorized return percentages for aligned price arrays"""
+    return (current - initial) / initial * 100
+
+
 def review_all_decisions():
     """Review all logged decisions with current performance"""
     tracker = PerformanceTracker()
@@ -35,12 +119,16 @@ def review_all_decisions():
         print("No decisions logged yet.")
         return
     
-    print("\n" + "="*120)
-    print("INVESTMENT DECISION PERFORMANCE REVIEW")
-    print("="*120 + "\n")
+    # Buffer the whole report and emit it with a single write
+    lines = [
+        "\n", REVIEW_BANNER,
+        "INVESTMENT DECISION PERFORMANCE REVIEW\n",
+        REVIEW_BANNER, "\n",
+        REVIEW_ROW_FMT.format('Date', 'Ticker', 'Model', 'Rec', 'Conv', 'Price@', 'Now', 'Return', 'Status'),
+        REVIEW_RULE
+    ]
     
-    print(f"{'Date':<12} {'Ticker':<8} {'Model':<25} {'Rec':<10} {'Conv':<6} {'Price@':<10} {'Now':<10} {'Return':<10} {'Status':<10}")
-    print("-"*120)
+    prices = get_current_prices(d['ticker'] for d in decisions)
     
     total_decisions = len(decisions)
     correct_decisions = 0
@@ -48,15 +136,15 @@ def review_all_decisions():
     analyzed_count = 0
     
     for decision in decisions:
-        date = decision['date']
+        decision_date = decision['date']
         ticker = decision['ticker']
-        model = decision['model'][:23]
-        rec = decision['recommendation'][:8]
+        model = decision['model']
+        rec = decision['recommendation']
         conv = f"{decision['conviction']}/10" if decision['conviction'] else "N/A"
         initial_price = decision['current_price']
         
         # Get current price
-        current_price = get_current_price(ticker)
+        current_price = prices.get(ticker)
         
         if initial_price and current_price:
             actual_return = calculate_return(initial_price, current_price)
@@ -85,16 +173,18 @@ def review_all_decisions():
             ret_str = "N/A"
             status = "❓ Unknown"
         
-        print(f"{date:<12} {ticker:<8} {model:<25} {rec:<10} {conv:<6} {price_at:<10} {price_now:<10} {ret_str:<10} {status:<10}")
+        lines.append(REVIEW_ROW_FMT.format(decision_date, ticker, model, rec, conv, price_at, price_now, ret_str, status))
     
-    print("-"*120)
-    print(f"\nSUMMARY:")
-    print(f"  Total Decisions: {total_decisions}")
-    print(f"  Analyzable: {analyzed_count} ({analyzed_count/total_decisions*100:.1f}%)")
+    lines.append(REVIEW_RULE)
+    lines.append("\nSUMMARY:\n")
+    lines.append(f"  Total Decisions: {total_decisions}\n")
+    lines.append(f"  Analyzable: {analyzed_count} ({analyzed_count/total_decisions*100:.1f}%)\n")
     if analyzed_count > 0:
-        print(f"  Correct: {correct_decisions} ({correct_decisions/analyzed_count*100:.1f}%)")
-        print(f"  Average Return: {total_return/analyzed_count:+.1f}%")
-    print("="*120 + "\n")
+        lines.append(f"  Correct: {correct_decisions} ({correct_decisions/analyzed_count*100:.1f}%)\n")
+        lines.append(f"  Average Return: {total_return/analyzed_count:+.1f}%\n")
+    lines.append(REVIEW_BANNER + "\n")
+    
+    sys.stdout.write("".join(lines))
 
 
 def review_by_ticker(ticker: str):
@@ -158,25 +248,28 @@ def review_by_model(model: str):
     # Calculate returns for BUY recommendations
     if buy_decisions:
         print("BUY RECOMMENDATIONS:")
-        total_return = 0
-        count = 0
+        prices = get_current_prices(d['ticker'] for d in buy_decisions)
         
-        for decision in buy_decisions:
-            ticker = decision['ticker']
-            initial_price = decision['current_price']
-            current_price = get_current_price(ticker)
-            
-            if initial_price and current_price:
-                actual_return = calculate_return(initial_price, current_price)
-                total_return += actual_return
-                count += 1
-                
-                status = "✅" if actual_return > 0 else "❌"
-                print(f"  {status} {ticker}: {actual_return:+.1f}% (${initial_price:.2f} → ${current_price:.2f})")
+        # Missing or zero prices become NaN and are masked out below
+        n = len(buy_decisions)
+        initial = np.fromiter((d['current_price'] or np.nan for d in buy_decisions),
+                              dtype=np.float64, count=n)
+        current = np.fromiter((prices.get(d['ticker']) or np.nan for d in buy_decisions),
+                              dtype=np.float64, count=n)
+        returns = _compute_returns(initial, current)
+        valid = np.isfinite(returns)
         
-        if count > 0:
-            print(f"\n  Average Return: {total_return/count:+.1f}%")
-            print(f"  Win Rate: {sum(1 for d in buy_decisions if calculate_return(d['current_price'], get_current_price(d['ticker'])) > 0) / count * 100:.1f}%")
+        for i in np.flatnonzero(valid):
+            actual_return = returns[i]
+            status = "✅" if actual_return > 0 else "❌"
+            print(f"  {status} {buy_decisions[i]['ticker']}: {actual_return:+.1f}% "
+                  f"(${initial[i]:.2f} → ${current[i]:.2f})")
+        
+        if valid.any():
+            valid_returns = returns[valid]
+            wins = np.sum(valid_returns > 0)
+            print(f"\n  Average Return: {valid_returns.mean():+.1f}%")
+            print(f"  Win Rate: {wins / valid_returns.size * 100:.1f}%")
     
     print("\n" + "="*80 + "\n")
 
@@ -194,13 +287,15 @@ def review_recent(days: int = 30):
     print(f"DECISIONS IN LAST {days} DAYS")
     print("="*80 + "\n")
     
+    prices = get_current_prices(d['ticker'] for d in decisions)
+    
     for decision in decisions:
         print(f"{decision['date']} - {decision['ticker']}: {decision['recommendation']}")
         print(f"  Model: {decision['model']}")
         print(f"  Conviction: {decision['conviction']}/10")
         print(f"  Price: ${decision['current_price']:.2f}")
         
-        current_price = get_current_price(decision['ticker'])
+        current_price = prices.get(decision['ticker'])
         if current_price:
             actual_return = calculate_return(decision['current_price'], current_price)
             print(f"  Current: ${current_price:.2f} ({actual_return:+.1f}%)")
@@ -217,16 +312,21 @@ Examples:
   python review_performance.py --ticker AAPL      # Review AAPL decisions
   python review_performance.py --model gemini-3-flash-preview
   python review_performance.py --recent 7         # Last 7 days
+  python review_performance.py --compact          # Write decisions_log.json snapshot
         """
     )
     
     parser.add_argument('--ticker', type=str, help='Review specific ticker')
     parser.add_argument('--model', type=str, help='Review specific model')
     parser.add_argument('--recent', type=int, help='Review decisions from last N days')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write the decision log as a pretty-printed JSON array')
     
     args = parser.parse_args()
     
-    if args.ticker:
+    if args.compact:
+        PerformanceTracker().compact()
+    elif args.ticker:
         review_by_ticker(args.ticker.upper())
     elif args.model:
         review_by_model(args.model)
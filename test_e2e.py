@@ -15,23 +15,116 @@ Usage:
 
 import sys
 import time
-from datetime import datetime
-from analyze_complete import InvestmentAnalyzer, analyze_multiple_stocks, print_comparison
+import asyncio
+import mmap
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+from analyze_complete import (
+    InvestmentAnalyzer,
+    VALID_RECOMMENDATIONS,
+    analyze_multiple_stocks,
+    print_comparison
+)
+from config import Config
 from utils.display import print_header, print_success, print_error, print_warning, print_info
 
+# Maximum number of ticker pipelines in flight at once (bounds provider load)
+MAX_CONCURRENT_ANALYSES = 3
+_ANALYSIS_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+# LLM requests issued by one full pipeline (5 agents + key-events extraction)
+LLM_CALLS_PER_ANALYSIS = 6
+
+
+class _TokenBucket:
+    """Async token bucket allowing `max_rate` acquisitions per `time_period` seconds"""
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._last) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _model_rpm(model_name: str) -> int:
+    """Documented requests-per-minute for a model (falls back to the default tier)"""
+    for model_info in Config.AVAILABLE_MODELS.values():
+        if model_info['name'] == model_name:
+            return model_info['rpm']
+    return Config.RATE_LIMITS['default']['rpm']
+
+
+# Paces pipeline starts to the provider's RPM instead of fixed sleeps
+_LIMITER = _TokenBucket(max_rate=max(1.0, _model_rpm(Config.DEFAULT_MODEL) / LLM_CALLS_PER_ANALYSIS))
+
 def print_test_header(test_name: str):
     """Print a test section header"""
-    print("\n" + "="*80)
-    print(f"TEST: {test_name}")
-    print("="*80 + "\n")
+    sys.stdout.write(f"\n{'='*80}\nTEST: {test_name}\n{'='*80}\n\n")
+
+# Per-run analysis cache: several tests share AAPL/MSFT/GOOGL, so each ticker's
+# pipeline runs at most once (in-flight tasks are shared between concurrent tests)
+_COMPLETED: Dict[str, InvestmentAnalyzer] = {}
+_IN_FLIGHT: Dict[str, asyncio.Task] = {}
+
+async def _run_pipeline(ticker: str, verbose: bool) -> InvestmentAnalyzer:
+    """Run one ticker's pipeline once a concurrency slot and a rate token are free"""
+    async with _ANALYSIS_SLOTS, _LIMITER:
+        analyzer = InvestmentAnalyzer(ticker, verbose=verbose)
+        await analyzer.analyze_async()
+    _COMPLETED[ticker] = analyzer
+    return analyzer
+
+async def _analyze(ticker: str, verbose: bool = False) -> InvestmentAnalyzer:
+    """Get the (cached) analyzer for a ticker, running its pipeline if needed"""
+    if ticker in _COMPLETED:
+        return _COMPLETED[ticker]
+    task = _IN_FLIGHT.get(ticker)
+    if task is None:
+        task = _IN_FLIGHT[ticker] = asyncio.ensure_future(_run_pipeline(ticker, verbose))
+    return await task
+
+def _file_contains(path: str, marker: bytes) -> bool:
+    """Check a written file for a byte marker via mmap, without reading/decoding it"""
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(marker) != -1
+        except ValueError:  # empty file cannot be mapped
+            return False
 
-def test_single_stock():
+def _cached_results(tickers: List[str]) -> Optional[List[Dict]]:
+    """Results for tickers that have already been analyzed this run"""
+    return [_COMPLETED[t].results for t in tickers if t in _COMPLETED] or None
+
+async def _analyze_many(tickers: List[str]) -> List[dict]:
+    """Analyze several tickers concurrently, preserving input order"""
+    analyzers = await asyncio.gather(*(_analyze(t) for t in tickers))
+    return [a.results for a in analyzers]
+
+async def test_single_stock():
     """Test 1: Single stock analysis"""
     print_test_header("Single Stock Analysis (AAPL)")
     
     try:
-        analyzer = InvestmentAnalyzer('AAPL', verbose=True)
-        results = analyzer.analyze()
+        analyzer = await _analyze('AAPL', verbose=True)
+        results = analyzer.results
         
         # Validate results structure
         assert 'metadata' in results, "Missing metadata"
@@ -44,7 +137,7 @@ def test_single_stock():
         
         # Validate decision
         decision = results['cio_synthesis']['decision']
-        assert decision['recommendation'] in ['STRONG BUY', 'BUY', 'HOLD', 'REDUCE', 'SELL'], \
+        assert decision['recommendation'] in VALID_RECOMMENDATIONS, \
             f"Invalid recommendation: {decision['recommendation']}"
         assert 0 <= decision['conviction'] <= 10, \
             f"Invalid conviction: {decision['conviction']}"
@@ -58,87 +151,67 @@ def test_single_stock():
         print_error(f"❌ Test 1 FAILED: {str(e)}")
         return False
 
-def test_save_json():
+async def test_save_json():
     """Test 2: Save results as JSON"""
     print_test_header("Save Results (JSON Format)")
     
     try:
-        analyzer = InvestmentAnalyzer('MSFT', verbose=False)
-        results = analyzer.analyze()
-        analyzer.save_results(output_dir='test_output', format='json')
+        analyzer = await _analyze('MSFT')
         
-        # Check if file was created
-        import os
-        import glob
-        json_files = glob.glob('test_output/MSFT_*.json')
-        assert len(json_files) > 0, "No JSON file created"
+        # Per-test scratch directory, removed automatically even on failure
+        with tempfile.TemporaryDirectory(prefix='e2e_') as tmp:
+            json_path, data = analyzer.save_results(output_dir=tmp, format='json',
+                                                    return_payload=True)
+            
+            # Check if file was created (content is validated from the written payload)
+            assert json_path and Path(json_path).stat().st_size > 0, "No JSON file created"
         
         # Validate JSON structure
-        import json
-        with open(json_files[0], 'r') as f:
-            data = json.load(f)
-            assert 'metadata' in data, "Missing metadata in JSON"
-            assert 'cio_synthesis' in data, "Missing cio_synthesis in JSON"
+        assert 'metadata' in data, "Missing metadata in JSON"
+        assert 'cio_synthesis' in data, "Missing cio_synthesis in JSON"
         
         print_success("✅ Test 2 PASSED: JSON save works correctly")
-        
-        # Cleanup
-        import shutil
-        shutil.rmtree('test_output')
-        
         return True
         
     except Exception as e:
         print_error(f"❌ Test 2 FAILED: {str(e)}")
         return False
 
-def test_save_txt():
+async def test_save_txt():
     """Test 3: Save results as TXT"""
     print_test_header("Save Results (TXT Format)")
     
     try:
-        analyzer = InvestmentAnalyzer('GOOGL', verbose=False)
-        results = analyzer.analyze()
-        analyzer.save_results(output_dir='test_output', format='txt')
+        analyzer = await _analyze('GOOGL')
         
-        # Check if file was created
-        import os
-        import glob
-        txt_files = glob.glob('test_output/GOOGL_*.txt')
-        assert len(txt_files) > 0, "No TXT file created"
+        # Per-test scratch directory, removed automatically even on failure
+        with tempfile.TemporaryDirectory(prefix='e2e_') as tmp:
+            txt_path, content = analyzer.save_results(output_dir=tmp, format='txt',
+                                                      return_payload=True)
+            
+            # Check the report header reached disk (full content is validated from the payload)
+            assert txt_path and _file_contains(txt_path, b'Investment Analysis Report: GOOGL'), \
+                "No TXT file created"
         
         # Validate TXT content
-        with open(txt_files[0], 'r') as f:
-            content = f.read()
-            assert 'INVESTMENT ANALYSIS REPORT' in content, "Missing header in TXT"
-            assert 'FINAL INVESTMENT DECISION' in content, "Missing decision in TXT"
+        assert 'INVESTMENT ANALYSIS REPORT' in content, "Missing header in TXT"
+        assert 'FINAL INVESTMENT DECISION' in content, "Missing decision in TXT"
         
         print_success("✅ Test 3 PASSED: TXT save works correctly")
-        
-        # Cleanup
-        import shutil
-        shutil.rmtree('test_output')
-        
         return True
         
     except Exception as e:
         print_error(f"❌ Test 3 FAILED: {str(e)}")
         return False
 
-def test_multiple_stocks():
+async def test_multiple_stocks():
     """Test 4: Multiple stock analysis"""
     print_test_header("Multiple Stock Analysis (3 stocks)")
     
     try:
         tickers = ['AAPL', 'MSFT', 'GOOGL']
-        results = []
-        
-        for ticker in tickers:
-            print_info(f"Analyzing {ticker}...")
-            analyzer = InvestmentAnalyzer(ticker, verbose=False)
-            result = analyzer.analyze()
-            results.append(result)
-            time.sleep(10)  # Avoid rate limits
+        print_info(f"Analyzing {', '.join(tickers)} concurrently...")
+        results = await _analyze_many(tickers)
         
         # Validate all results
         assert len(results) == 3, f"Expected 3 results, got {len(results)}"
@@ -161,7 +234,9 @@ def test_comparison_table():
     
     try:
         tickers = ['AAPL', 'MSFT', 'GOOGL']
-        results = analyze_multiple_stocks(tickers, save=False, compare=True)
+        # Reuse the pipelines already run by tests 1-4
+        results = analyze_multiple_stocks(tickers, save=False, compare=True,
+                                          results=_cached_results(tickers))
         
         # Validate comparison was printed (visual check needed)
         assert len(results) == 3, f"Expected 3 results, got {len(results)}"
@@ -173,7 +248,7 @@ def test_comparison_table():
         print_error(f"❌ Test 5 FAILED: {str(e)}")
         return False
 
-def test_different_sectors():
+async def test_different_sectors():
     """Test 6: Different sector stocks"""
     print_test_header("Cross-Sector Analysis")
     
@@ -186,19 +261,15 @@ def test_different_sectors():
             'WMT': 'Consumer Defensive'
         }
         
-        results = []
         for ticker, description in stocks.items():
             print_info(f"Testing {ticker} ({description})...")
-            analyzer = InvestmentAnalyzer(ticker, verbose=False)
-            result = analyzer.analyze()
-            results.append(result)
-            
-            # Validate
+        results = await _analyze_many(list(stocks))
+        
+        # Validate
+        for ticker, result in zip(stocks, results):
             decision = result['cio_synthesis']['decision']
             assert decision['recommendation'] is not None, \
                 f"Missing recommendation for {ticker}"
-            
-            time.sleep(10)  # Avoid rate limits
         
         print_success("✅ Test 6 PASSED: Cross-sector analysis works")
         return True
@@ -210,13 +281,32 @@ def test_different_sectors():
 def quick_test():
     """Quick test - just one stock"""
     print_test_header("QUICK TEST (Single Stock Only)")
-    return test_single_stock()
+    return asyncio.run(test_single_stock())
+
+async def _run_tests(tests) -> List[bool]:
+    """Run the suite under one event loop; independent tests overlap"""
+    outcomes = {}
+    
+    # Tests 1-4 and 6 are independent analyses; they share one event loop and cache
+    concurrent = [i for i, (_, func) in enumerate(tests) if asyncio.iscoroutinefunction(func)]
+    print_info(f"Running {len(concurrent)} independent tests concurrently...")
+    for i, result in zip(concurrent, await asyncio.gather(*(tests[i][1]() for i in concurrent))):
+        outcomes[i] = result
+    
+    # Test 5 drives the synchronous analyze_multiple_stocks() over cached results
+    for i, (_, func) in enumerate(tests):
+        if i not in outcomes:
+            outcomes[i] = await asyncio.to_thread(func)
+    
+    return [outcomes[i] for i in range(len(tests))]
 
 def full_test():
     """Run all tests"""
+    start_time = time.time()
+    
     print_header("INVESTMENT ANALYSIS SYSTEM V3.0 - E2E TESTING")
-    print_info(f"Test Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print_warning("⚠️  This will take ~30-40 minutes to complete")
+    print_info(f"Test Started: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
+    print_warning("⚠️  This will take ~10-15 minutes to complete")
     print_warning("⚠️  Ensure you have sufficient API quota available\n")
     
     # Track results
@@ -229,39 +319,29 @@ def full_test():
         ("Cross-Sector Analysis", test_different_sectors),
     ]
     
-    results = []
-    start_time = time.time()
+    # Concurrency is bounded by MAX_CONCURRENT_ANALYSES and paced by _LIMITER
+    outcomes = asyncio.run(_run_tests(tests))
+    results = [(name, result) for (name, _), result in zip(tests, outcomes)]
     
-    for i, (name, test_func) in enumerate(tests, 1):
-        print_info(f"\n[{i}/{len(tests)}] Running: {name}")
-        result = test_func()
-        results.append((name, result))
-        
+    for name, result in results:
         if not result:
-            print_warning(f"⚠️  Test failed, but continuing...")
-        
-        # Pause between tests to avoid rate limits
-        if i < len(tests):
-            print_info("Pausing 15 seconds to avoid rate limits...")
-            time.sleep(15)
+            print_warning(f"⚠️  {name} failed, but continuing...")
     
     # Summary
     duration = time.time() - start_time
+    duration_str = f"{duration:.1f} seconds ({duration/60:.1f} minutes)"
     passed = sum(1 for _, r in results if r)
     total = len(results)
     
-    print("\n" + "="*80)
-    print("TEST SUMMARY")
-    print("="*80)
-    
-    for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status}: {name}")
-    
-    print("\n" + "-"*80)
-    print(f"Results: {passed}/{total} tests passed")
-    print(f"Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
-    print("="*80 + "\n")
+    lines = ["", "="*80, "TEST SUMMARY", "="*80]
+    lines.extend(f"{'✅ PASS' if result else '❌ FAIL'}: {name}" for name, result in results)
+    lines += [
+        "\n" + "-"*80,
+        f"Results: {passed}/{total} tests passed",
+        f"Duration: {duration_str}",
+        "="*80 + "\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     if passed == total:
         print_success("🎉 ALL TESTS PASSED! System is fully functional.")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the valuation engine's tier lookups
+
+Run with pytest, or directly:
+    python test_valuation.py
+"""
+
+import math
+import numpy as np
+from valuation.dcf_calculator import ValuationEngine
+
+NAN = float('nan')
+
+
+def test_pe_nan_growth_takes_lowest_base_pe():
+    """NaN growth falls through to the 12x base P/E, not the top 28x tier"""
+    result = ValuationEngine("TEST").calculate_pe_valuation(5, 6, 20, 7, NAN)
+    assert math.isclose(result['justified_pe'], 12 * 0.85), f"❌ Got justified P/E {result['justified_pe']}"
+    assert math.isclose(result['intrinsic_value_per_share'], 12 * 0.85 * 6), f"❌ Got fair value {result['intrinsic_value_per_share']}"
+
+
+def test_pe_nan_quality_takes_lowest_multiplier():
+    """NaN quality score falls through to the 0.55 multiplier, not 1.0"""
+    result = ValuationEngine("TEST").calculate_pe_valuation(5, 6, 20, NAN, 0.08)
+    assert math.isclose(result['intrinsic_value_per_share'], 15 * 0.55 * 6), f"❌ Got fair value {result['intrinsic_value_per_share']}"
+
+
+def test_pfcf_nan_inputs_take_fall_through_tiers():
+    """P/FCF uses the same fall-through tiers for NaN growth and quality"""
+    result = ValuationEngine("TEST").calculate_pfcf_valuation(4, 20, NAN, NAN)
+    assert math.isclose(result['justified_pfcf'], 12 * 0.55), f"❌ Got justified P/FCF {result['justified_pfcf']}"
+
+
+def test_batch_multiples_match_scalar_for_nan():
+    """Batched P/E treats NaN rows like the scalar path"""
+    engine = ValuationEngine("TEST")
+    batch = engine.calculate_pe_valuation_batch([5, 5], [6, 6], [7, NAN], [NAN, 0.08])
+    assert np.allclose(batch['justified_pe'], [12 * 0.85, 15 * 0.55]), f"❌ Got {batch['justified_pe']}"
+
+
+def test_growth_nan_market_cap_takes_small_cap_limit():
+    """NaN market cap falls through to the 30% size cap, not the mega-cap 10%"""
+    result = ValuationEngine("TEST").calculate_dynamic_growth_rate(0.25, 0.25, 0.25, NAN, 'mature')
+    assert math.isclose(result['size_cap'], 0.30), f"❌ Got size cap {result['size_cap']}"
+
+
+def test_wacc_nan_inputs_take_fall_through_premiums():
+    """NaN market cap adds no size premium; NaN leverage adds no risk premium"""
+    result = ValuationEngine("TEST").calculate_dynamic_wacc(0.04, 1.0, NAN, NAN, 0.06)
+    assert result['size_premium'] == 0.0, f"❌ Got size premium {result['size_premium']}"
+    assert result['risk_premium'] == 0.0, f"❌ Got risk premium {result['risk_premium']}"
+
+
+def test_margin_of_safety_nan_is_invalid():
+    """NaN price or intrinsic value is not a STRONG BUY"""
+    engine = ValuationEngine("TEST")
+    for intrinsic_value, current_price in ((100.0, NAN), (NAN, 50.0)):
+        result = engine.calculate_margin_of_safety(intrinsic_value, current_price)
+        assert result['margin_of_safety_%'] is None, f"❌ Got {result}"
+    
+    batch = engine.calculate_margin_of_safety_batch([100.0, NAN, 100.0], [NAN, 50.0, 50.0])
+    assert list(batch['assessment'][:2]) == ['', ''], f"❌ Got {batch['assessment']}"
+    assert np.isnan(batch['margin_of_safety_%'][:2]).all(), f"❌ Got {batch['margin_of_safety_%']}"
+    assert batch['assessment'][2].startswith("🟢 STRONG BUY"), f"❌ Got {batch['assessment'][2]}"
+
+
+def test_dcf_report_nan_price_omits_margin_of_safety():
+    """A NaN price still renders the report, just without the MOS section"""
+    engine = ValuationEngine("TEST")
+    dcf_result = engine.calculate_dcf(1e9, 0.10, shares_outstanding=1e8)
+    report = engine.format_dcf_report(dcf_result, current_price=NAN)
+    assert "Intrinsic Value Per Share" in report, "❌ Missing per-share line"
+    assert "UNDERVALUED" not in report and "OVERVALUED" not in report, "❌ Unexpected MOS section"
+    
+    report = engine.format_dcf_report(dcf_result, current_price=1.0)
+    assert "UNDERVALUED" in report, "❌ Missing MOS section for a valid price"
+
+
+if __name__ == '__main__':
+    import sys
+    import pytest
+    sys.exit(pytest.main([__file__, '-q']))
@@ -2,8 +2,22 @@
 Display Utilities
 Functions for terminal output formatting
 """
+import sys
 from config import Config
 
+# Default width and rules, bound once (explicit widths are built on demand)
+_DEFAULT_WIDTH = Config.SEPARATOR_WIDTH
+_EQ_RULE = "=" * _DEFAULT_WIDTH
+_DASH_RULE = "-" * _DEFAULT_WIDTH
+
+
+def refresh_config():
+    """Rebind the cached default width and rules after Config.SEPARATOR_WIDTH changes"""
+    global _DEFAULT_WIDTH, _EQ_RULE, _DASH_RULE
+    _DEFAULT_WIDTH = Config.SEPARATOR_WIDTH
+    _EQ_RULE = "=" * _DEFAULT_WIDTH
+    _DASH_RULE = "-" * _DEFAULT_WIDTH
+
 
 def print_separator(title: str = "", width: int = None):
     """
@@ -13,14 +27,12 @@ def print_separator(title: str = "", width: int = None):
         title: Optional title text
         width: Width of separator (default from config)
     """
-    width = width or Config.SEPARATOR_WIDTH
+    rule = "=" * width if width else _EQ_RULE
     
     if title:
-        print(f"\n{'='*width}")
-        print(f"  {title}")
-        print(f"{'='*width}\n")
+        sys.stdout.write(f"\n{rule}\n  {title}\n{rule}\n\n")
     else:
-        print(f"{'='*width}")
+        sys.stdout.write(f"{rule}\n")
 
 
 def print_section(title: str, width: int = None):
@@ -31,10 +43,8 @@ def print_section(title: str, width: int = None):
         title: Section title
         width: Width of separator (default from config)
     """
-    width = width or Config.SEPARATOR_WIDTH
-    print(f"\n{'-'*width}")
-    print(f"  {title}")
-    print(f"{'-'*width}")
+    rule = "-" * width if width else _DASH_RULE
+    sys.stdout.write(f"\n{rule}\n  {title}\n{rule}\n")
 
 
 def print_error(message: str):
@@ -65,8 +75,5 @@ def print_header(text: str, width: int = None):
         text: Header text
         width: Width of header (default from config)
     """
-    width = width or Config.SEPARATOR_WIDTH
-    print("\n" + "="*width)
-    padding = (width - len(text) - 2) // 2
-    print(" "*padding + text)
-    print("="*width)
+    rule = "=" * width if width else _EQ_RULE
+    sys.stdout.write(f"\n{rule}\n{text:^{len(rule)}}\n{rule}\n")
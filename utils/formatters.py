@@ -2,8 +2,17 @@
 Formatting Utilities
 Functions for formatting numbers, currencies, and percentages
 """
+import math
+from bisect import bisect_right
 from typing import Union, Optional
 
+# Errors raised when formatting a non-numeric value (the single "N/A" guard for all formatters)
+_NOT_NUMERIC = (TypeError, ValueError)
+
+# Magnitude buckets for format_large_number: (suffix, divisor) per threshold band
+_LARGE_NUMBER_THRESHOLDS = (1_000, 1_000_000, 1_000_000_000)
+_LARGE_NUMBER_SCALES = (("", 1), ("K", 1_000), ("M", 1_000_000), ("B", 1_000_000_000))
+
 
 def format_currency(value: Union[int, float], decimals: int = 0) -> str:
     """
@@ -16,13 +25,10 @@ def format_currency(value: Union[int, float], decimals: int = 0) -> str:
     Returns:
         Formatted string (e.g., "$1,234,567.89")
     """
-    if not isinstance(value, (int, float)):
-        return "N/A"
-    
-    if decimals == 0:
-        return f"${value:,.0f}"
-    else:
+    try:
         return f"${value:,.{decimals}f}"
+    except _NOT_NUMERIC:
+        return "N/A"
 
 
 def format_percentage(value: Union[int, float], decimals: int = 2) -> str:
@@ -36,10 +42,10 @@ def format_percentage(value: Union[int, float], decimals: int = 2) -> str:
     Returns:
         Formatted string (e.g., "15.00%")
     """
-    if not isinstance(value, (int, float)):
+    try:
+        return f"{value * 100:.{decimals}f}%"
+    except _NOT_NUMERIC:
         return "N/A"
-    
-    return f"{value * 100:.{decimals}f}%"
 
 
 def format_number(value: Union[int, float], decimals: int = 0) -> str:
@@ -53,13 +59,10 @@ def format_number(value: Union[int, float], decimals: int = 0) -> str:
     Returns:
         Formatted string (e.g., "1,234,567")
     """
-    if not isinstance(value, (int, float)):
-        return "N/A"
-    
-    if decimals == 0:
-        return f"{value:,.0f}"
-    else:
+    try:
         return f"{value:,.{decimals}f}"
+    except _NOT_NUMERIC:
+        return "N/A"
 
 
 def format_large_number(value: Union[int, float]) -> str:
@@ -70,19 +73,14 @@ def format_large_number(value: Union[int, float]) -> str:
         value: Number to format
         
     Returns:
-        Formatted string (e.g., "$1.23B", "$456.7M")
+        Formatted string (e.g., "$1.23B", "$456.7M"; "N/A" for NaN/inf)
     """
-    if not isinstance(value, (int, float)):
+    try:
+        if not math.isfinite(value):
+            return "N/A"
+        abs_value = abs(value)
+        sign = "-" if value < 0 else ""
+        suffix, divisor = _LARGE_NUMBER_SCALES[bisect_right(_LARGE_NUMBER_THRESHOLDS, abs_value)]
+        return f"{sign}${abs_value / divisor:.2f}{suffix}"
+    except _NOT_NUMERIC:
         return "N/A"
-    
-    abs_value = abs(value)
-    sign = "-" if value < 0 else ""
-    
-    if abs_value >= 1_000_000_000:
-        return f"{sign}${abs_value / 1_000_000_000:.2f}B"
-    elif abs_value >= 1_000_000:
-        return f"{sign}${abs_value / 1_000_000:.2f}M"
-    elif abs_value >= 1_000:
-        return f"{sign}${abs_value / 1_000:.2f}K"
-    else:
-        return f"{sign}${abs_value:.2f}"
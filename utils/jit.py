@@ -0,0 +1,15 @@
+"""
+JIT Utilities
+Optional Numba acceleration with a pure-Python fallback
+"""
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
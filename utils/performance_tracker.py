@@ -2,11 +2,111 @@
 Performance Tracker
 Logs investment decisions and tracks performance over time
 """
+import atexit
+import bisect
 import json
+import math
 import os
-from datetime import datetime
+import re
+import sys
+import weakref
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import Dict, Optional, List
-import csv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Column order of decision log entries (CSV mirror and columnar exports)
+_CSV_HEADERS = (
+    'timestamp', 'date', 'ticker', 'company_name', 'sector',
+    'model', 'recommendation', 'conviction', 'position_size',
+    'current_price', 'fair_value', 'upside_percent',
+    'intrinsic_value_range', 'margin_of_safety',
+    'quality_score', 'moat_rating', 'risk_score', 'risk_rating',
+    'expected_return_3y', 'composite_score',
+    'value_rec', 'growth_rec', 'risk_rec',
+    'analyst_agreement', 'key_catalyst', 'stop_loss',
+    'output_file', 'notes'
+)
+
+# Timestamp suffix of default export file names
+_EXPORT_STAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# Fields with a secondary index (value -> decisions) for the get_decisions_by_* queries
+_INDEXED_FIELDS = ('ticker', 'recommendation', 'model')
+
+# Low-cardinality string fields shared (interned) across cached decisions
+_INTERNED_FIELDS = frozenset((
+    'date', 'ticker', 'company_name', 'sector', 'model', 'recommendation',
+    'moat_rating', 'risk_rating', 'value_rec', 'growth_rec', 'risk_rec',
+    'analyst_agreement',
+))
+
+
+def _finite_or_none(value):
+    """Replace NaN/inf floats with None (recursively) so both JSON backends write null"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+def _dump_line(entry: Dict) -> bytes:
+    """Serialize one decision as a compact JSON Lines record"""
+    entry = _finite_or_none(entry)
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, separators=(',', ':')) + '\n').encode()
+
+
+def _dump_pretty(data) -> bytes:
+    """Serialize data as indented JSON"""
+    data = _finite_or_none(data)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Replace `path` with `data` atomically (write + fsync a temp file, then rename)"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _intern_decision(entry: Dict) -> Dict:
+    """Intern the keys and enum-like values of a decision so cached entries share them"""
+    return {
+        sys.intern(key): sys.intern(value) if key in _INTERNED_FIELDS and type(value) is str else value
+        for key, value in entry.items()
+    }
+
+
+def _flush_at_exit(flush_ref: weakref.WeakMethod) -> None:
+    """atexit hook: flush a batching tracker's buffer if the tracker still exists"""
+    flush = flush_ref()
+    if flush is not None:
+        flush()
+
+
+def _load(raw: bytes):
+    """Parse JSON bytes (stdlib fallback also covers NaN/Infinity written by json.dumps)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
 
 
 class PerformanceTracker:
@@ -20,47 +120,76 @@ class PerformanceTracker:
     - Generates performance reports
     """
     
-    def __init__(self, log_dir: str = "performance_logs"):
+    def __init__(self, log_dir: str = "performance_logs", write_csv: bool = True,
+                 batch_size: int = 1):
         """
         Initialize performance tracker
         
         Args:
             log_dir: Directory to store performance logs
+            write_csv: Also mirror each decision into decisions_log.csv, kept
+                on by default for readers of that file (the JSONL log is the
+                source of truth; pass False to skip the second write)
+            batch_size: Buffer this many decisions before writing them to disk
+                in one go (1 = write every decision immediately). Pending
+                entries are flushed on reads, close() and interpreter exit.
         """
         self.log_dir = log_dir
+        self.write_csv = write_csv
+        self.batch_size = max(1, batch_size)
         os.makedirs(log_dir, exist_ok=True)
         
-        # Main log files
-        self.json_log = os.path.join(log_dir, "decisions_log.json")
+        # Main log file (JSON Lines: one decision per line, append-only, source of truth)
+        self.json_log = os.path.join(log_dir, "decisions_log.jsonl")
         self.csv_log = os.path.join(log_dir, "decisions_log.csv")
+        # Pretty JSON array: legacy log format, now a human-readable snapshot written by compact()
+        self.json_snapshot = os.path.join(log_dir, "decisions_log.json")
+        
+        # Parsed decisions, valid while the log's (mtime_ns, size) matches _cache_stat
+        self._cache: List[Dict] = []
+        self._cache_stat = None
+        # ISO timestamps of _cache (appended in time order, so sorted for bisect)
+        self._timestamps: List[str] = []
+        
+        # Secondary indexes over _cache, valid while _index_stat == _cache_stat
+        self._index: Dict[str, Dict] = {}
+        self._index_stat = None
+        
+        # Persistent CSV append handle/writer, opened on first write
+        self._csv_fp = None
+        self._csv_writer = None
+        
+        # Decisions logged but not yet written (see batch_size)
+        self._buffer: List[Dict] = []
+        if self.batch_size > 1:
+            # Weak reference so the exit hook does not keep the tracker alive
+            atexit.register(_flush_at_exit, weakref.WeakMethod(self.flush))
         
         # Initialize log files if they don't exist
         self._initialize_logs()
     
     def _initialize_logs(self):
         """Create log files if they don't exist"""
-        # JSON log
+        # JSONL log (migrated once from the legacy array-form JSON log if present)
         if not os.path.exists(self.json_log):
-            with open(self.json_log, 'w') as f:
-                json.dump([], f)
-        
-        # CSV log with headers
-        if not os.path.exists(self.csv_log):
-            headers = [
-                'timestamp', 'date', 'ticker', 'company_name', 'sector',
-                'model', 'recommendation', 'conviction', 'position_size',
-                'current_price', 'fair_value', 'upside_percent',
-                'intrinsic_value_range', 'margin_of_safety',
-                'quality_score', 'moat_rating', 'risk_score', 'risk_rating',
-                'expected_return_3y', 'composite_score',
-                'value_rec', 'growth_rec', 'risk_rec',
-                'analyst_agreement', 'key_catalyst', 'stop_loss',
-                'output_file', 'notes'
-            ]
+            self._migrate_legacy_json()
+        
+        # CSV log with headers (only when mirroring to CSV)
+        if self.write_csv and not os.path.exists(self.csv_log):
+            import csv
             with open(self.csv_log, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
+                writer = csv.DictWriter(f, fieldnames=_CSV_HEADERS)
                 writer.writeheader()
     
+    def _migrate_legacy_json(self):
+        """Convert the legacy array-form decisions_log.json into the JSONL log"""
+        entries = []
+        if os.path.exists(self.json_snapshot):
+            with open(self.json_snapshot, 'rb') as f:
+                entries = _load(f.read())
+        
+        _write_atomic(self.json_log, b''.join(_dump_line(entry) for entry in entries))
+    
     def log_decision(self, analysis_data: Dict) -> None:
         """
         Log an investment decision
@@ -82,9 +211,9 @@ class PerformanceTracker:
                   analyst_agreement, key_catalyst, stop_loss,
                   output_file, notes
         """
-        # Create log entry
+        # Create log entry (date is the ISO timestamp's YYYY-MM-DD prefix)
         timestamp = datetime.now().isoformat()
-        date = datetime.now().strftime('%Y-%m-%d')
+        date = timestamp[:10]
         
         log_entry = {
             'timestamp': timestamp,
@@ -117,33 +246,69 @@ class PerformanceTracker:
             'notes': analysis_data.get('notes', ''),
         }
         
-        # Append to JSON log
-        self._append_to_json(log_entry)
-        
-        # Append to CSV log
-        self._append_to_csv(log_entry)
+        # Queue for the JSON (and optional CSV) logs
+        self._buffer.append(_intern_decision(log_entry))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
         
         print(f"📊 Decision logged: {log_entry['ticker']} - {log_entry['recommendation']}")
-        print(f"   Log files: {self.json_log}, {self.csv_log}")
+        if self.write_csv:
+            print(f"   Log files: {self.json_log}, {self.csv_log}")
+        else:
+            print(f"   Log file: {self.json_log}")
+    
+    def flush(self) -> None:
+        """Write all buffered decisions to the logs"""
+        if not self._buffer:
+            return
+        entries, self._buffer = self._buffer, []
+        
+        self._append_to_json(entries)
+        if self.write_csv:
+            self._append_to_csv(entries)
+    
+    def _append_to_json(self, entries: List[Dict]) -> None:
+        """Append entries to the JSONL log in a single write (no read-modify-write of the history)"""
+        cache_fresh = self._cache_stat is not None and self._cache_stat == self._log_stat()
+        
+        with open(self.json_log, 'ab') as f:
+            f.write(b''.join(_dump_line(entry) for entry in entries))
+        
+        # Keep the in-memory copy (and its indexes) in step instead of re-parsing
+        if cache_fresh:
+            index_fresh = self._index_stat == self._cache_stat
+            self._cache.extend(entries)
+            self._timestamps.extend(entry['timestamp'] for entry in entries)
+            self._cache_stat = self._log_stat()
+            if index_fresh:
+                for entry in entries:
+                    for field in _INDEXED_FIELDS:
+                        self._index[field][entry.get(field)].append(entry)
+                self._index_stat = self._cache_stat
+        else:
+            self._cache_stat = None
     
-    def _append_to_json(self, log_entry: Dict) -> None:
-        """Append entry to JSON log"""
-        # Read existing data
-        with open(self.json_log, 'r') as f:
-            data = json.load(f)
-        
-        # Append new entry
-        data.append(log_entry)
-        
-        # Write back
-        with open(self.json_log, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _append_to_csv(self, entries: List[Dict]) -> None:
+        """Append entries to CSV log through the tracker's shared writer"""
+        if self._csv_writer is None:
+            import csv
+            self._csv_fp = open(self.csv_log, 'a', newline='')
+            self._csv_writer = csv.DictWriter(self._csv_fp, fieldnames=_CSV_HEADERS)
+        self._csv_writer.writerows(entries)
+        self._csv_fp.flush()
     
-    def _append_to_csv(self, log_entry: Dict) -> None:
-        """Append entry to CSV log"""
-        with open(self.csv_log, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=log_entry.keys())
-            writer.writerow(log_entry)
+    def close(self) -> None:
+        """Flush pending decisions and close the persistent CSV handle
+        (reopened automatically on the next write)"""
+        self.flush()
+        if self._csv_fp is not None:
+            self._csv_fp.close()
+            self._csv_fp = None
+            self._csv_writer = None
+    
+    def __del__(self):
+        if getattr(self, '_buffer', None) or getattr(self, '_csv_fp', None) is not None:
+            self.close()
     
     def get_all_decisions(self) -> List[Dict]:
         """
@@ -152,8 +317,34 @@ class PerformanceTracker:
         Returns:
             List of decision dictionaries
         """
-        with open(self.json_log, 'r') as f:
-            return json.load(f)
+        return list(self._decisions())
+    
+    def _decisions(self) -> List[Dict]:
+        """Cached decision list, re-parsed only when the log file has changed"""
+        self.flush()
+        key = self._log_stat()
+        if key != self._cache_stat:
+            with open(self.json_log, 'rb') as f:
+                self._cache = [_intern_decision(_load(line)) for line in f if line.strip()]
+            self._timestamps = [d['timestamp'] for d in self._cache]
+            self._cache_stat = key
+        return self._cache
+    
+    def _lookup(self, field: str, value) -> List[Dict]:
+        """Decisions whose `field` equals `value`, via the lazily built secondary index"""
+        decisions = self._decisions()
+        if self._index_stat != self._cache_stat:
+            self._index = {f: defaultdict(list) for f in _INDEXED_FIELDS}
+            for d in decisions:
+                for f in _INDEXED_FIELDS:
+                    self._index[f][d.get(f)].append(d)
+            self._index_stat = self._cache_stat
+        return list(self._index[field].get(value, ()))
+    
+    def _log_stat(self) -> tuple:
+        """Cache key for the JSONL log: (mtime_ns, size)"""
+        stat = os.stat(self.json_log)
+        return (stat.st_mtime_ns, stat.st_size)
     
     def get_decisions_by_ticker(self, ticker: str) -> List[Dict]:
         """
@@ -165,8 +356,7 @@ class PerformanceTracker:
         Returns:
             List of decisions for that ticker
         """
-        all_decisions = self.get_all_decisions()
-        return [d for d in all_decisions if d['ticker'] == ticker]
+        return self._lookup('ticker', ticker)
     
     def get_decisions_by_recommendation(self, recommendation: str) -> List[Dict]:
         """
@@ -178,8 +368,7 @@ class PerformanceTracker:
         Returns:
             List of matching decisions
         """
-        all_decisions = self.get_all_decisions()
-        return [d for d in all_decisions if d['recommendation'] == recommendation]
+        return self._lookup('recommendation', recommendation)
     
     def get_decisions_by_model(self, model: str) -> List[Dict]:
         """
@@ -191,8 +380,7 @@ class PerformanceTracker:
         Returns:
             List of decisions from that model
         """
-        all_decisions = self.get_all_decisions()
-        return [d for d in all_decisions if d['model'] == model]
+        return self._lookup('model', model)
     
     def get_recent_decisions(self, days: int = 30) -> List[Dict]:
         """
@@ -204,14 +392,12 @@ class PerformanceTracker:
         Returns:
             List of recent decisions
         """
-        from datetime import timedelta
-        cutoff = datetime.now() - timedelta(days=days)
-        
-        all_decisions = self.get_all_decisions()
-        return [
-            d for d in all_decisions 
-            if datetime.fromisoformat(d['timestamp']) >= cutoff
-        ]
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        
+        # ISO timestamps sort lexicographically, so locate the cutoff by bisection
+        decisions = self._decisions()
+        start = bisect.bisect_left(self._timestamps, cutoff)
+        return decisions[start:]
     
     def generate_summary_report(self) -> str:
         """
@@ -225,23 +411,30 @@ class PerformanceTracker:
         if not decisions:
             return "No decisions logged yet."
         
-        # Basic stats
+        # Basic stats, conviction, tickers and models in a single pass
         total = len(decisions)
-        buy_count = len([d for d in decisions if d['recommendation'] == 'BUY'])
-        sell_count = len([d for d in decisions if d['recommendation'] == 'SELL'])
-        hold_count = len([d for d in decisions if d['recommendation'] == 'HOLD'])
-        
-        # Average conviction
-        convictions = [d['conviction'] for d in decisions if d['conviction'] is not None]
-        avg_conviction = sum(convictions) / len(convictions) if convictions else 0
-        
-        # Unique tickers
-        tickers = set(d['ticker'] for d in decisions)
-        
-        # Models used
-        models = set(d['model'] for d in decisions)
-        
-        report = f"""
+        rec_counts = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
+        conviction_sum = 0
+        conviction_count = 0
+        tickers = set()
+        models = set()
+        
+        for d in decisions:
+            rec = d['recommendation']
+            if rec in rec_counts:
+                rec_counts[rec] += 1
+            if d['conviction'] is not None:
+                conviction_sum += d['conviction']
+                conviction_count += 1
+            tickers.add(d['ticker'])
+            models.add(d['model'])
+        
+        buy_count = rec_counts['BUY']
+        sell_count = rec_counts['SELL']
+        hold_count = rec_counts['HOLD']
+        avg_conviction = conviction_sum / conviction_count if conviction_count else 0
+        
+        parts = [f"""
 ================================================================================
 INVESTMENT DECISION SUMMARY REPORT
 ================================================================================
@@ -265,41 +458,171 @@ MODELS USED: {len(models)}
 ================================================================================
 RECENT DECISIONS (Last 10):
 ================================================================================
-"""
+"""]
         
         # Show last 10 decisions
         for decision in decisions[-10:]:
-            report += f"""
+            conviction = decision['conviction']
+            parts.append(f"""
 {decision['date']} | {decision['ticker']:6s} | {decision['recommendation']:10s} | 
-  Price: ${decision['current_price']:.2f} | Fair Value: ${decision['fair_value']:.2f} | 
-  Conviction: {decision['conviction']}/10 | Model: {decision['model']}
-"""
+  Price: {_money(decision['current_price'])} | Fair Value: {_money(decision['fair_value'])} | 
+  Conviction: {'N/A' if conviction is None else f'{conviction}/10'} | Model: {decision['model']}
+""")
+        
+        return ''.join(parts)
+    
+    def compact(self, output_file: str = None) -> str:
+        """
+        Write the JSONL log out as a pretty-printed JSON array for human inspection
+        
+        Args:
+            output_file: Output file path (defaults to performance_logs/decisions_log.json)
+        
+        Returns:
+            Path to the snapshot file
+        """
+        output_file = output_file or self.json_snapshot
+        decisions = self._decisions()
+        
+        _write_atomic(output_file, _dump_pretty(decisions))
         
-        return report
+        print(f"🗜️  Compacted {len(decisions)} decisions to: {output_file}")
+        return output_file
     
-    def export_for_analysis(self, output_file: str = None) -> str:
+    def export_for_analysis(self, output_file: str = None, format: str = "json") -> str:
         """
         Export decisions to a file for further analysis
         
         Args:
-            output_file: Output file path (defaults to performance_logs/export_TIMESTAMP.json)
+            output_file: Output file path (defaults to performance_logs/export_TIMESTAMP.<format>)
+            format: 'json' (pretty-printed array) or 'parquet' (columnar snapshot,
+                requires pyarrow or fastparquet)
         
         Returns:
             Path to exported file
         """
+        if format not in ("json", "parquet"):
+            raise ValueError(f"Unsupported export format: {format}")
+        
         if output_file is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            output_file = os.path.join(self.log_dir, f"export_{timestamp}.json")
+            timestamp = datetime.now().strftime(_EXPORT_STAMP_FORMAT)
+            output_file = os.path.join(self.log_dir, f"export_{timestamp}.{format}")
         
         decisions = self.get_all_decisions()
         
-        with open(output_file, 'w') as f:
-            json.dump(decisions, f, indent=2)
+        if format == "parquet":
+            import pandas as pd
+            tmp_file = output_file + '.tmp'
+            pd.DataFrame(decisions, columns=list(_CSV_HEADERS)).to_parquet(tmp_file, compression='zstd')
+            os.replace(tmp_file, output_file)
+        else:
+            _write_atomic(output_file, _dump_pretty(decisions))
         
         print(f"📄 Exported {len(decisions)} decisions to: {output_file}")
         return output_file
 
 
+def _money(value) -> str:
+    """Format a price as $1234.56 ("N/A" when missing or non-numeric)"""
+    try:
+        return f"${value:.2f}"
+    except (TypeError, ValueError):
+        return "N/A"
+
+
+def _score(line: str) -> Optional[float]:
+    """Parse 'Label: 7/10' into 7.0 (None if malformed)"""
+    try:
+        return float(line.split(':')[1].strip().split('/')[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _moat(line: str) -> Optional[str]:
+    """Map a moat rating line onto Strong/Medium/Weak (None if unrated)"""
+    upper = line.upper()
+    for rating in ('Strong', 'Medium', 'Weak'):
+        if rating.upper() in upper:
+            return rating
+    return None
+
+
+def _cio_recommendation(line: str) -> str:
+    """'Recommendation: X' keeps the full value; RECOMMENDATION headers keep the first word"""
+    value = line.split(':')[1].strip()
+    return value if 'Recommendation:' in line else value.split()[0]
+
+
+# Field specs for extract_decision_data: field -> (line predicate, line parser, text guard).
+# Each analysis text is scanned once with the matching *_LINES regex, which selects every
+# line any predicate could accept; a field is parsed from the first line its predicate
+# accepts, only when its guard (if any) holds for the whole text, and dropped when the
+# parser returns None.
+_CIO_LINES = re.compile(r'^.*(?:Recommendation:|RECOMMENDATION:|Conviction:).*$', re.M)
+_CIO_FIELDS = {
+    'recommendation': (
+        lambda line: 'Recommendation:' in line or 'RECOMMENDATION:' in line,
+        _cio_recommendation,
+        lambda text: 'FINAL RECOMMENDATION' in text or 'Recommendation:' in text,
+    ),
+    'conviction': (lambda line: 'Conviction:' in line, _score, None),
+}
+
+_VALUE_LINES = re.compile(
+    r'^.*(?:Quality Score:|Moat Strength|YOUR RATING).*$|^[^\S\n]*\*\*RECOMMENDATION.*$', re.M
+)
+_VALUE_FIELDS = {
+    'quality_score': (lambda line: 'Quality Score:' in line and '/10' in line, _score, None),
+    'moat_rating': (
+        lambda line: 'Moat Strength' in line or 'YOUR RATING' in line,
+        _moat,
+        lambda text: 'Moat' in text,
+    ),
+    'value_rec': (
+        lambda line: line.strip().startswith('**RECOMMENDATION'),
+        lambda line: line.split(':')[1].strip().split()[0],
+        lambda text: 'RECOMMENDATION:' in text,
+    ),
+}
+
+_RISK_LINES = re.compile(r'^.*(?:Risk Score:|Risk Rating:|RISK RATING:).*$', re.M)
+_RISK_FIELDS = {
+    'risk_score': (lambda line: 'Risk Score:' in line and '/10' in line, _score, None),
+    'risk_rating': (
+        lambda line: 'Risk Rating:' in line or 'RISK RATING:' in line,
+        lambda line: line.split(':')[1].strip().split('(')[0].strip(),
+        None,
+    ),
+}
+
+
+def _parse_blob(pattern: re.Pattern, text: str, specs: Dict[str, tuple]) -> Dict:
+    """
+    Extract every field of one analysis text in a single scan
+    
+    Args:
+        pattern: Multiline regex matching every line any predicate could accept
+        text: Analysis text to scan
+        specs: Field name -> (line predicate, line parser, text guard or None)
+    
+    Returns:
+        Field name -> parsed value (fields not found or unparseable are omitted)
+    """
+    pending = {key: spec for key, spec in specs.items() if spec[2] is None or spec[2](text)}
+    found = {}
+    for match in pattern.finditer(text):
+        if not pending:
+            break
+        line = match.group()
+        for key, (accepts, parse, _) in list(pending.items()):
+            if accepts(line):
+                del pending[key]
+                value = parse(line)
+                if value is not None:
+                    found[key] = value
+    return found
+
+
 def extract_decision_data(analyzer) -> Dict:
     """
     Extract decision data from InvestmentAnalyzer for logging
@@ -339,83 +662,20 @@ def extract_decision_data(analyzer) -> Dict:
         if decision.get('entry_price_low') and decision.get('entry_price_high'):
             data['intrinsic_value_range'] = f"${decision.get('entry_price_low'):.2f}-${decision.get('entry_price_high'):.2f}"
     
-    # Fallback: parse from text if structured data not available
+    # Fallback: parse recommendation/conviction from text if structured data not available
     else:
         cio_full = cio_synthesis.get('full_synthesis', '')
         if cio_full:
-            # Parse recommendation
-            if 'FINAL RECOMMENDATION' in cio_full or 'Recommendation:' in cio_full:
-                for line in cio_full.split('\n'):
-                    if 'Recommendation:' in line:
-                        data['recommendation'] = line.split(':')[1].strip()
-                        break
-                    elif 'RECOMMENDATION:' in line:
-                        data['recommendation'] = line.split(':')[1].strip().split()[0]
-                        break
-            
-            # Parse conviction
-            if 'Conviction:' in cio_full:
-                for line in cio_full.split('\n'):
-                    if 'Conviction:' in line:
-                        try:
-                            conv = line.split(':')[1].strip()
-                            data['conviction'] = float(conv.split('/')[0])
-                        except:
-                            pass
-                        break
+            data.update(_parse_blob(_CIO_LINES, cio_full, _CIO_FIELDS))
     
-    # Extract from individual agents
+    # Extract quality score, moat rating and value recommendation
     value_analysis = analyzer.results.get('value_analysis', {}).get('full_analysis', '')
     if value_analysis:
-        # Extract quality score
-        if 'Quality Score:' in value_analysis:
-            for line in value_analysis.split('\n'):
-                if 'Quality Score:' in line and '/10' in line:
-                    try:
-                        score = line.split(':')[1].strip()
-                        data['quality_score'] = float(score.split('/')[0])
-                    except:
-                        pass
-                    break
-        
-        # Extract moat rating
-        if 'Moat' in value_analysis:
-            for line in value_analysis.split('\n'):
-                if 'Moat Strength' in line or 'YOUR RATING' in line:
-                    if 'STRONG' in line.upper():
-                        data['moat_rating'] = 'Strong'
-                    elif 'MEDIUM' in line.upper():
-                        data['moat_rating'] = 'Medium'
-                    elif 'WEAK' in line.upper():
-                        data['moat_rating'] = 'Weak'
-                    break
-        
-        # Extract value recommendation
-        if 'RECOMMENDATION:' in value_analysis:
-            for line in value_analysis.split('\n'):
-                if line.strip().startswith('**RECOMMENDATION'):
-                    data['value_rec'] = line.split(':')[1].strip().split()[0]
-                    break
+        data.update(_parse_blob(_VALUE_LINES, value_analysis, _VALUE_FIELDS))
     
+    # Extract risk score and risk rating
     risk_analysis = analyzer.results.get('risk_analysis', {}).get('full_analysis', '')
     if risk_analysis:
-        # Extract risk score
-        if 'Risk Score:' in risk_analysis:
-            for line in risk_analysis.split('\n'):
-                if 'Risk Score:' in line and '/10' in line:
-                    try:
-                        score = line.split(':')[1].strip()
-                        data['risk_score'] = float(score.split('/')[0])
-                    except:
-                        pass
-                    break
-        
-        # Extract risk rating
-        if 'RISK RATING:' in risk_analysis or 'Risk Rating:' in risk_analysis:
-            for line in risk_analysis.split('\n'):
-                if 'Risk Rating:' in line or 'RISK RATING:' in line:
-                    rating = line.split(':')[1].strip()
-                    data['risk_rating'] = rating.split('(')[0].strip()
-                    break
+        data.update(_parse_blob(_RISK_LINES, risk_analysis, _RISK_FIELDS))
     
     return data
@@ -2,8 +2,305 @@
 DCF Calculator Module
 2-Stage Discounted Cash Flow valuation model
 """
+import math
 import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Optional
+from utils.jit import njit
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Growth adjustment by company stage
+_STAGE_MULTIPLIERS = MappingProxyType({
+    'startup': 1.2,      # Can sustain higher growth
+    'growth': 1.0,       # Historical is good proxy
+    'mature': 0.8,       # Growth typically slows
+    'declining': 0.5     # Significant slowdown
+})
+
+# Piecewise tiers as lookup tables: values[_tier_index(bounds, x, side)].
+# side='left' selects the tier for x > bound, side='right' for x >= bound;
+# NaN fails every comparison, so it takes the ladder's fall-through tier.
+
+# Growth size cap by market cap ($B, x > bound): law of large numbers.
+# Every cap is within the 30% growth ceiling, so the cap also applies the ceiling.
+_GROWTH_CEILING = 0.30
+_SIZE_CAP_BOUNDS = np.array([10.0, 50.0, 200.0, 500.0])
+_SIZE_CAPS = np.minimum(np.array([0.30, 0.20, 0.15, 0.12, 0.10]), _GROWTH_CEILING)
+
+# WACC size premium by market cap ($B, x >= bound): micro, small, mid, large, mega-cap
+_SIZE_PREMIUM_BOUNDS = np.array([2.0, 10.0, 50.0, 200.0])
+_SIZE_PREMIUMS = np.array([0.035, 0.025, 0.015, 0.008, 0.0])
+
+# WACC financial risk premium by debt/equity (x > bound): very low, low, moderate, high debt
+_LEVERAGE_BOUNDS = np.array([0.5, 1.0, 2.0])
+_RISK_PREMIUMS = np.array([0.0, 0.008, 0.015, 0.025])
+
+# Base multiples by growth % (x > bound)
+_GROWTH_PCT_BOUNDS = np.array([5.0, 10.0, 15.0])
+_BASE_PE = np.array([12, 15, 20, 28])
+_BASE_PFCF = np.array([12, 16, 22, 30])
+
+# Multiple adjustment by quality score (x >= bound)
+_QUALITY_BOUNDS = np.array([4, 6, 8])
+_QUALITY_MULTIPLIERS = np.array([0.55, 0.70, 0.85, 1.0])
+
+# Margin of safety assessment by MOS % (x > bound)
+_MOS_BOUNDS = np.array([-25.0, -10.0, 10.0, 25.0])
+_MOS_ASSESSMENTS = np.array([
+    "🔴 AVOID - Significantly overvalued",
+    "🟠 CAUTION - Moderately overvalued",
+    "⚪ FAIR - Roughly fairly valued",
+    "🟡 BUY - Moderate undervaluation",
+    "🟢 STRONG BUY - Significant undervaluation",
+])
+
+# calculate_dcf_frame optional input columns: (column, calculate_dcf_batch argument, default)
+_DCF_FRAME_COLUMNS = (
+    ('discount_rate', 'discount_rates', 0.10),
+    ('terminal_growth_rate', 'terminal_growth_rates', 0.03),
+    ('high_growth_years', 'high_growth_years', 5),
+    ('shares_outstanding', 'shares_outstanding', None),
+)
+
+# Shared, read-only results for inputs that cannot be valued
+_DCF_FCF_ERROR = MappingProxyType({
+    'error': 'FCF must be positive for DCF calculation',
+    'intrinsic_value_per_share': 0,
+    'total_present_value': 0,
+    'terminal_value': 0
+})
+_MOS_INVALID_VALUE = MappingProxyType({
+    'margin_of_safety_%': None,
+    'recommendation': 'Cannot calculate - invalid intrinsic value'
+})
+
+# format_dcf_report templates: the whole report is one format_map over the DCF
+# result dict, with the optional per-share line and MOS section pre-rendered
+_REPORT_ERROR_TMPL = """
+DCF VALUATION - ERROR
+---------------------
+⚠️  {error}
+
+DCF calculation could not be completed.
+"""
+
+_REPORT_TMPL = """
+================================================================================
+DISCOUNTED CASH FLOW (DCF) VALUATION
+================================================================================
+
+📊 INTRINSIC VALUE CALCULATION:
+
+Total Enterprise Value: ${total_present_value:,.0f}
+{per_share_line}
+BREAKDOWN:
+- Stage 1 Value (High Growth): ${stage1_value:,.0f}
+- Stage 2 Value (Terminal): ${terminal_value:,.0f}
+
+ASSUMPTIONS USED:
+- Current FCF: ${assumptions[current_fcf]:,.0f}
+- High Growth Period: {assumptions[high_growth_years]} years
+- Growth Rate (Stage 1): {assumptions[growth_rate_%]:.1f}%
+- Discount Rate (WACC): {assumptions[discount_rate_%]:.1f}%
+- Terminal Growth Rate: {assumptions[terminal_growth_%]:.1f}%
+{mos_section}
+================================================================================
+IMPORTANT NOTES FOR ANALYSIS:
+- DCF is sensitive to growth rate assumptions - test different scenarios
+- Market may disagree with DCF due to different risk assessments
+- Use DCF as ONE input alongside qualitative factors
+- Skeptics should question growth and discount rate assumptions
+================================================================================
+"""
+
+_REPORT_PER_SHARE_TMPL = "Intrinsic Value Per Share: ${intrinsic_value_per_share:.2f}\n"
+
+_REPORT_MOS_TMPL = """
+================================================================================
+MARGIN OF SAFETY ANALYSIS
+================================================================================
+
+Current Market Price: ${current_price:.2f}
+DCF Intrinsic Value: ${intrinsic_value:.2f}
+
+Margin of Safety: {margin_of_safety_%:.1f}%
+Price/Value Ratio: {price_to_value_ratio:.2f}x
+
+{assessment}
+
+Interpretation:
+- If MOS > 25%: Strong Buy Signal (significant undervaluation)
+- If MOS 10-25%: Buy Signal (moderate undervaluation)
+- If MOS -10 to +10%: Fairly Valued
+- If MOS < -25%: Avoid (significantly overvalued)
+
+Current Assessment: {status}
+Potential Upside/Downside: {margin_of_safety_%:+.1f}%
+"""
+
+
+@njit('Tuple((float64, float64, float64, float64[::1]))(float64, float64, float64, float64, int64)',
+      cache=True)
+def _dcf_core(fcf: float, growth_rate: float, discount_rate: float,
+              terminal_growth_rate: float, high_growth_years: int):
+    """2-stage DCF kernel: (stage 1 PV, terminal PV, undiscounted terminal value, projected FCF)"""
+    one_plus_g = 1.0 + growth_rate
+    one_plus_r = 1.0 + discount_rate
+    
+    # Stage 1: projected FCF per year, with running (1+g)^t and (1+r)^t products
+    # instead of a power per year
+    projected_fcf = np.empty(high_growth_years)
+    growth_factor = 1.0
+    discount_factor = 1.0
+    for year in range(high_growth_years):
+        growth_factor *= one_plus_g
+        discount_factor *= one_plus_r
+        projected_fcf[year] = fcf * growth_factor
+    
+    # PV is a geometric series in q = 1 + d, d = (g-r)/(1+r):
+    # sum_{t=1..N} FCF * q^t = FCF * q * (q^N - 1) / d, with q^N - 1 = expm1(N * log1p(d))
+    # so there is no cancellation when growth and discount rates are close
+    d = (growth_rate - discount_rate) / one_plus_r
+    if d == 0.0:
+        stage1_value = fcf * high_growth_years
+    else:
+        stage1_value = fcf * (1.0 + d) * math.expm1(high_growth_years * math.log1p(d)) / d
+    
+    # Stage 2: Terminal Value (reusing (1+g)^N and (1+r)^N from Stage 1)
+    fcf_terminal = fcf * growth_factor * one_plus_g
+    terminal_value = fcf_terminal / (discount_rate - terminal_growth_rate)
+    pv_terminal = terminal_value / discount_factor
+    
+    return stage1_value, pv_terminal, terminal_value, projected_fcf
+
+
+def _specialize_dcf_core(high_growth_years: int):
+    """
+    Generate _dcf_core with the year loop unrolled for a fixed high_growth_years
+    
+    Same operations in the same order as _dcf_core (so bit-identical results),
+    minus the loop and kernel-call overhead; projected FCF is returned as a list.
+    
+    Args:
+        high_growth_years: Years of high growth to specialize for
+        
+    Returns:
+        Function (fcf, growth_rate, discount_rate, terminal_growth_rate) -> core tuple
+    """
+    n = high_growth_years
+    lines = [
+        f"def _dcf_core_{n}(fcf, growth_rate, discount_rate, terminal_growth_rate):",
+        "    one_plus_g = 1.0 + growth_rate",
+        "    one_plus_r = 1.0 + discount_rate",
+        "    g1 = one_plus_g",
+        "    r1 = one_plus_r",
+    ]
+    for year in range(2, n + 1):
+        lines.append(f"    g{year} = g{year - 1} * one_plus_g")
+        lines.append(f"    r{year} = r{year - 1} * one_plus_r")
+    lines += [
+        "    d = (growth_rate - discount_rate) / one_plus_r",
+        "    if d == 0.0:",
+        f"        stage1_value = fcf * {n}",
+        "    else:",
+        f"        stage1_value = fcf * (1.0 + d) * expm1({n} * log1p(d)) / d",
+        f"    terminal_value = fcf * g{n} * one_plus_g / (discount_rate - terminal_growth_rate)",
+        f"    projected_fcf = [{', '.join(f'fcf * g{year}' for year in range(1, n + 1))}]",
+        f"    return stage1_value, terminal_value / r{n}, terminal_value, projected_fcf",
+    ]
+    namespace = {'expm1': math.expm1, 'log1p': math.log1p}
+    exec("\n".join(lines), namespace)
+    return namespace[f"_dcf_core_{n}"]
+
+
+# Unrolled DCF cores for the common high-growth periods (5 years is the default)
+_DCF_SPECIALIZATIONS = {n: _specialize_dcf_core(n) for n in (3, 5, 7, 10)}
+
+
+def _tier_index(bounds: np.ndarray, x, side: str = 'left', nan_index: int = 0):
+    """np.searchsorted tier index, with NaN routed to nan_index (searchsorted sorts it last)"""
+    return np.where(np.isnan(x), nan_index, np.searchsorted(bounds, x, side=side))
+
+
+def _justified_multiples(base_multiples: np.ndarray, growth_rates, quality_scores) -> np.ndarray:
+    """Base multiple by growth tier x quality multiplier, for array inputs"""
+    growth_pct = np.asarray(growth_rates, dtype=np.float64) * 100
+    base = base_multiples[_tier_index(_GROWTH_PCT_BOUNDS, growth_pct)]
+    quality_multiplier = _QUALITY_MULTIPLIERS[_tier_index(_QUALITY_BOUNDS, quality_scores, side='right')]
+    return base * quality_multiplier
+
+
+# Growth and WACC math, memoized on the raw rates plus the tier indices of the
+# lookup tables above (portfolio screens repeat the same rates and tiers)
+@lru_cache(maxsize=8192)
+def _growth_components(historical_revenue_cagr: float, historical_earnings_cagr: float,
+                       historical_fcf_cagr: float, company_stage: str, size_tier: int) -> tuple:
+    """(historical_avg, stage_adjusted, size_cap, final_growth)"""
+    # Start with historical average (weighted towards FCF as most conservative)
+    historical_avg = (
+        historical_revenue_cagr * 0.3 +
+        historical_earnings_cagr * 0.3 +
+        historical_fcf_cagr * 0.4
+    )
+    
+    # Apply stage adjustment
+    stage_adjusted = historical_avg * _STAGE_MULTIPLIERS.get(company_stage, 1.0)
+    
+    # Take the minimum of stage-adjusted and size cap (which includes the 30% ceiling),
+    # floored at 0%
+    size_cap = _SIZE_CAPS[size_tier]
+    final_growth = max(0.0, min(stage_adjusted, size_cap))
+    
+    return historical_avg, stage_adjusted, size_cap, final_growth
+
+
+@lru_cache(maxsize=8192)
+def _wacc_components(risk_free_rate: float, beta: float, equity_risk_premium: float,
+                     size_tier: int, leverage_tier: int) -> tuple:
+    """(cost_of_equity, size_premium, risk_premium)"""
+    size_premium = _SIZE_PREMIUMS[size_tier]
+    risk_premium = _RISK_PREMIUMS[leverage_tier]
+    
+    # Cost of Equity using CAPM with adjustments
+    cost_of_equity = (
+        risk_free_rate +
+        (beta * equity_risk_premium) +
+        size_premium +
+        risk_premium
+    )
+    
+    return cost_of_equity, size_premium, risk_premium
+
+
+# Reasoning/breakdown strings, memoized on their exact inputs so recurring
+# valuations (same tiers, same rates) reuse the formatted text
+@lru_cache(maxsize=4096, typed=True)
+def _growth_reasoning(historical_avg: float, company_stage: str, stage_adjusted: float,
+                      market_cap_b: float, size_cap: float, final_growth: float) -> str:
+    return (f"Historical avg: {historical_avg:.1%}, "
+            f"Stage ({company_stage}): {stage_adjusted:.1%}, "
+            f"Size constraint (${market_cap_b:.1f}B): {size_cap:.1%}, "
+            f"Final: {final_growth:.1%}")
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _wacc_breakdown(risk_free_rate: float, beta: float, equity_risk_premium: float,
+                    size_premium: float, risk_premium: float, wacc: float) -> str:
+    return (f"WACC = {risk_free_rate:.1%} (RF) + "
+            f"{beta:.2f} × {equity_risk_premium:.1%} (ERP) + "
+            f"{size_premium:.1%} (Size) + {risk_premium:.1%} (Risk) = {wacc:.1%}")
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _multiple_reasoning(growth_pct: float, quality_score, multiple_name: str,
+                        multiple: float, base_name: str, base_value: float) -> str:
+    return (f"Growth {growth_pct:.1f}% + Quality {quality_score}/10 "
+            f"→ Justified {multiple_name} {multiple:.1f}x × {base_name} ${base_value:.2f}")
 
 
 class ValuationEngine:
@@ -11,6 +308,8 @@ class ValuationEngine:
     Mathematical valuation calculator using 2-Stage DCF Model
     """
     
+    __slots__ = ('ticker',)
+    
     def __init__(self, ticker: str):
         self.ticker = ticker
     
@@ -20,7 +319,8 @@ class ValuationEngine:
         historical_earnings_cagr: float,
         historical_fcf_cagr: float,
         market_cap: float,
-        company_stage: str = 'mature'
+        company_stage: str = 'mature',
+        build_reasoning: bool = False
     ) -> Dict[str, float]:
         """
         Calculate dynamic growth rate based on multiple factors
@@ -31,55 +331,29 @@ class ValuationEngine:
             historical_fcf_cagr: 5-year FCF CAGR
             market_cap: Current market cap in dollars
             company_stage: 'startup', 'growth', 'mature', or 'declining'
+            build_reasoning: Also build the human-readable 'reasoning' string
+                (otherwise None; skips the formatting for numeric-only callers)
             
         Returns:
             Dictionary with growth rate and reasoning
         """
-        # Start with historical average (weighted towards FCF as most conservative)
-        historical_avg = (
-            historical_revenue_cagr * 0.3 +
-            historical_earnings_cagr * 0.3 +
-            historical_fcf_cagr * 0.4
-        )
-        
-        # Apply stage adjustment
-        stage_multipliers = {
-            'startup': 1.2,      # Can sustain higher growth
-            'growth': 1.0,       # Historical is good proxy
-            'mature': 0.8,       # Growth typically slows
-            'declining': 0.5     # Significant slowdown
-        }
-        stage_adjusted = historical_avg * stage_multipliers.get(company_stage, 1.0)
-        
-        # Apply size constraint (law of large numbers)
+        # Size constraint tier (law of large numbers); the rest is memoized per tier
         market_cap_b = market_cap / 1e9  # Convert to billions
+        size_tier = int(_tier_index(_SIZE_CAP_BOUNDS, market_cap_b))
         
-        if market_cap_b > 500:
-            size_cap = 0.10  # Very hard to grow >10% when you're huge
-        elif market_cap_b > 200:
-            size_cap = 0.12
-        elif market_cap_b > 50:
-            size_cap = 0.15
-        elif market_cap_b > 10:
-            size_cap = 0.20
-        else:
-            size_cap = 0.30  # Smaller companies can grow faster
-        
-        # Take the minimum of stage-adjusted and size cap
-        final_growth = min(stage_adjusted, size_cap)
-        
-        # Floor at 0%, cap at 30%
-        final_growth = max(0.0, min(final_growth, 0.30))
+        historical_avg, stage_adjusted, size_cap, final_growth = _growth_components(
+            historical_revenue_cagr, historical_earnings_cagr, historical_fcf_cagr,
+            company_stage, size_tier
+        )
         
         return {
             'growth_rate': final_growth,
             'historical_avg': historical_avg,
             'stage_adjusted': stage_adjusted,
             'size_cap': size_cap,
-            'reasoning': f"Historical avg: {historical_avg:.1%}, "
-                        f"Stage ({company_stage}): {stage_adjusted:.1%}, "
-                        f"Size constraint (${market_cap_b:.1f}B): {size_cap:.1%}, "
-                        f"Final: {final_growth:.1%}"
+            'reasoning': _growth_reasoning(historical_avg, company_stage, stage_adjusted,
+                                           market_cap_b, size_cap, final_growth)
+                         if build_reasoning else None
         }
     
     def calculate_dynamic_wacc(
@@ -88,7 +362,8 @@ class ValuationEngine:
         beta: float = 1.0,
         market_cap: float = 100e9,
         debt_to_equity: float = 0.5,
-        equity_risk_premium: float = 0.065
+        equity_risk_premium: float = 0.065,
+        build_reasoning: bool = False
     ) -> Dict[str, float]:
         """
         Calculate dynamic WACC based on company characteristics
@@ -99,40 +374,20 @@ class ValuationEngine:
             market_cap: Market capitalization in dollars
             debt_to_equity: Debt/Equity ratio
             equity_risk_premium: Expected market return over risk-free (typically 6-7%)
+            build_reasoning: Also build the human-readable 'breakdown' string
+                (otherwise None; skips the formatting for numeric-only callers)
             
         Returns:
             Dictionary with WACC and breakdown
         """
-        # Size premium based on market cap
+        # Size and leverage tiers; the rest is memoized per tier
         market_cap_b = market_cap / 1e9
+        size_tier = int(_tier_index(_SIZE_PREMIUM_BOUNDS, market_cap_b, side='right',
+                                      nan_index=len(_SIZE_PREMIUM_BOUNDS)))
+        leverage_tier = int(_tier_index(_LEVERAGE_BOUNDS, debt_to_equity))
         
-        if market_cap_b < 2:
-            size_premium = 0.035  # Micro-cap: +3.5%
-        elif market_cap_b < 10:
-            size_premium = 0.025  # Small-cap: +2.5%
-        elif market_cap_b < 50:
-            size_premium = 0.015  # Mid-cap: +1.5%
-        elif market_cap_b < 200:
-            size_premium = 0.008  # Large-cap: +0.8%
-        else:
-            size_premium = 0.0    # Mega-cap: 0%
-        
-        # Financial risk premium based on leverage
-        if debt_to_equity > 2.0:
-            risk_premium = 0.025  # High debt: +2.5%
-        elif debt_to_equity > 1.0:
-            risk_premium = 0.015  # Moderate debt: +1.5%
-        elif debt_to_equity > 0.5:
-            risk_premium = 0.008  # Low debt: +0.8%
-        else:
-            risk_premium = 0.0    # Very low debt: 0%
-        
-        # Cost of Equity using CAPM with adjustments
-        cost_of_equity = (
-            risk_free_rate +
-            (beta * equity_risk_premium) +
-            size_premium +
-            risk_premium
+        cost_of_equity, size_premium, risk_premium = _wacc_components(
+            risk_free_rate, beta, equity_risk_premium, size_tier, leverage_tier
         )
         
         # For simplicity, assume all equity financing
@@ -147,9 +402,9 @@ class ValuationEngine:
             'equity_risk_premium': equity_risk_premium,
             'size_premium': size_premium,
             'risk_premium': risk_premium,
-            'breakdown': f"WACC = {risk_free_rate:.1%} (RF) + "
-                        f"{beta:.2f} × {equity_risk_premium:.1%} (ERP) + "
-                        f"{size_premium:.1%} (Size) + {risk_premium:.1%} (Risk) = {wacc:.1%}"
+            'breakdown': _wacc_breakdown(risk_free_rate, beta, equity_risk_premium,
+                                         size_premium, risk_premium, wacc)
+                         if build_reasoning else None
         }
     
     def calculate_pe_valuation(
@@ -158,7 +413,8 @@ class ValuationEngine:
         forward_eps: float,
         historical_pe_5y: float,
         quality_score: int,
-        growth_rate: float
+        growth_rate: float,
+        build_reasoning: bool = False
     ) -> Dict[str, float]:
         """
         Calculate intrinsic value using P/E multiple approach
@@ -169,6 +425,8 @@ class ValuationEngine:
             historical_pe_5y: Average P/E ratio over 5 years
             quality_score: Financial quality score (0-10)
             growth_rate: Expected growth rate (as decimal)
+            build_reasoning: Also build the human-readable 'reasoning' string
+                (otherwise None; skips the formatting for numeric-only callers)
             
         Returns:
             Dictionary with valuation and justified P/E
@@ -177,24 +435,10 @@ class ValuationEngine:
         growth_pct = growth_rate * 100
         
         # Base P/E from growth
-        if growth_pct > 15:
-            base_pe = 28
-        elif growth_pct > 10:
-            base_pe = 20
-        elif growth_pct > 5:
-            base_pe = 15
-        else:
-            base_pe = 12
+        base_pe = _BASE_PE[_tier_index(_GROWTH_PCT_BOUNDS, growth_pct)]
         
         # Quality adjustment
-        if quality_score >= 8:
-            quality_multiplier = 1.0
-        elif quality_score >= 6:
-            quality_multiplier = 0.85
-        elif quality_score >= 4:
-            quality_multiplier = 0.70
-        else:
-            quality_multiplier = 0.55
+        quality_multiplier = _QUALITY_MULTIPLIERS[_tier_index(_QUALITY_BOUNDS, quality_score, side='right')]
         
         justified_pe = base_pe * quality_multiplier
         
@@ -208,8 +452,9 @@ class ValuationEngine:
             'justified_pe': justified_pe,
             'eps_used': eps_to_use,
             'historical_pe': historical_pe_5y,
-            'reasoning': f"Growth {growth_pct:.1f}% + Quality {quality_score}/10 "
-                        f"→ Justified P/E {justified_pe:.1f}x × EPS ${eps_to_use:.2f}"
+            'reasoning': _multiple_reasoning(growth_pct, quality_score, 'P/E',
+                                             justified_pe, 'EPS', eps_to_use)
+                         if build_reasoning else None
         }
     
     def calculate_pfcf_valuation(
@@ -217,7 +462,8 @@ class ValuationEngine:
         fcf_per_share: float,
         historical_pfcf_5y: float,
         quality_score: int,
-        growth_rate: float
+        growth_rate: float,
+        build_reasoning: bool = False
     ) -> Dict[str, float]:
         """
         Calculate intrinsic value using P/FCF multiple approach
@@ -227,6 +473,8 @@ class ValuationEngine:
             historical_pfcf_5y: Average P/FCF ratio over 5 years
             quality_score: Financial quality score (0-10)
             growth_rate: Expected growth rate (as decimal)
+            build_reasoning: Also build the human-readable 'reasoning' string
+                (otherwise None; skips the formatting for numeric-only callers)
             
         Returns:
             Dictionary with valuation and justified P/FCF
@@ -234,24 +482,10 @@ class ValuationEngine:
         growth_pct = growth_rate * 100
         
         # Base P/FCF from growth
-        if growth_pct > 15:
-            base_pfcf = 30
-        elif growth_pct > 10:
-            base_pfcf = 22
-        elif growth_pct > 5:
-            base_pfcf = 16
-        else:
-            base_pfcf = 12
+        base_pfcf = _BASE_PFCF[_tier_index(_GROWTH_PCT_BOUNDS, growth_pct)]
         
         # Quality adjustment (same as P/E)
-        if quality_score >= 8:
-            quality_multiplier = 1.0
-        elif quality_score >= 6:
-            quality_multiplier = 0.85
-        elif quality_score >= 4:
-            quality_multiplier = 0.70
-        else:
-            quality_multiplier = 0.55
+        quality_multiplier = _QUALITY_MULTIPLIERS[_tier_index(_QUALITY_BOUNDS, quality_score, side='right')]
         
         justified_pfcf = base_pfcf * quality_multiplier
         
@@ -262,10 +496,79 @@ class ValuationEngine:
             'justified_pfcf': justified_pfcf,
             'fcf_per_share': fcf_per_share,
             'historical_pfcf': historical_pfcf_5y,
-            'reasoning': f"Growth {growth_pct:.1f}% + Quality {quality_score}/10 "
-                        f"→ Justified P/FCF {justified_pfcf:.1f}x × FCF ${fcf_per_share:.2f}"
+            'reasoning': _multiple_reasoning(growth_pct, quality_score, 'P/FCF',
+                                             justified_pfcf, 'FCF', fcf_per_share)
+                         if build_reasoning else None
         }
         
+    def calculate_pe_valuation_batch(
+        self,
+        trailing_eps,
+        forward_eps,
+        quality_scores,
+        growth_rates
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate P/E intrinsic values for many companies at once
+        
+        Array counterpart of calculate_pe_valuation (inputs broadcast together).
+        
+        Args:
+            trailing_eps: Trailing 12-month EPS
+            forward_eps: Forward 12-month EPS estimates (used where > 0)
+            quality_scores: Financial quality scores (0-10)
+            growth_rates: Expected growth rates (as decimal)
+            
+        Returns:
+            Dictionary of arrays with valuation and justified P/E
+        """
+        justified_pe = _justified_multiples(_BASE_PE, growth_rates, quality_scores)
+        trailing_eps = np.asarray(trailing_eps, dtype=np.float64)
+        forward_eps = np.asarray(forward_eps, dtype=np.float64)
+        
+        # Forward EPS where available, otherwise trailing (fused in one pass with numexpr)
+        if numexpr is not None:
+            intrinsic_value = numexpr.evaluate("justified_pe * where(forward_eps > 0, forward_eps, trailing_eps)")
+        else:
+            intrinsic_value = justified_pe * np.where(forward_eps > 0, forward_eps, trailing_eps)
+        
+        return {
+            'intrinsic_value_per_share': intrinsic_value,
+            'justified_pe': justified_pe,
+        }
+    
+    def calculate_pfcf_valuation_batch(
+        self,
+        fcf_per_share,
+        quality_scores,
+        growth_rates
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate P/FCF intrinsic values for many companies at once
+        
+        Array counterpart of calculate_pfcf_valuation (inputs broadcast together).
+        
+        Args:
+            fcf_per_share: Free cash flow per share (TTM)
+            quality_scores: Financial quality scores (0-10)
+            growth_rates: Expected growth rates (as decimal)
+            
+        Returns:
+            Dictionary of arrays with valuation and justified P/FCF
+        """
+        justified_pfcf = _justified_multiples(_BASE_PFCF, growth_rates, quality_scores)
+        fcf_per_share = np.asarray(fcf_per_share, dtype=np.float64)
+        
+        if numexpr is not None:
+            intrinsic_value = numexpr.evaluate("justified_pfcf * fcf_per_share")
+        else:
+            intrinsic_value = justified_pfcf * fcf_per_share
+        
+        return {
+            'intrinsic_value_per_share': intrinsic_value,
+            'justified_pfcf': justified_pfcf,
+        }
+    
     def calculate_dcf(
         self,
         fcf: float,
@@ -290,16 +593,12 @@ class ValuationEngine:
             shares_outstanding: Number of shares
             
         Returns:
-            Dictionary with valuation results
+            Dictionary with valuation results (a shared read-only mapping
+            when FCF <= 0)
         """
         # Validation
         if fcf <= 0:
-            return {
-                'error': 'FCF must be positive for DCF calculation',
-                'intrinsic_value_per_share': 0,
-                'total_present_value': 0,
-                'terminal_value': 0
-            }
+            return _DCF_FCF_ERROR
         
         if growth_rate <= 0 or growth_rate > 1.0:
             print(f"⚠️  Warning: Growth rate {growth_rate:.1%} unrealistic. Using 10%.")
@@ -309,23 +608,18 @@ class ValuationEngine:
             print(f"⚠️  Warning: Adjusting discount rate...")
             discount_rate = terminal_growth_rate + 0.05
         
-        # Stage 1: High Growth Period
-        projected_fcf = []
-        present_value_fcf = []
-        
-        for year in range(1, high_growth_years + 1):
-            fcf_year = fcf * ((1 + growth_rate) ** year)
-            projected_fcf.append(fcf_year)
-            
-            pv = fcf_year / ((1 + discount_rate) ** year)
-            present_value_fcf.append(pv)
-        
-        stage1_value = sum(present_value_fcf)
-        
-        # Stage 2: Terminal Value
-        fcf_terminal = fcf * ((1 + growth_rate) ** (high_growth_years + 1))
-        terminal_value = fcf_terminal / (discount_rate - terminal_growth_rate)
-        pv_terminal = terminal_value / ((1 + discount_rate) ** high_growth_years)
+        # Stage 1 (High Growth Period) and Stage 2 (Terminal Value)
+        specialized = _DCF_SPECIALIZATIONS.get(high_growth_years)
+        if specialized is not None:
+            stage1_value, pv_terminal, terminal_value, projected_fcf = specialized(
+                fcf, growth_rate, discount_rate, terminal_growth_rate
+            )
+        else:
+            stage1_value, pv_terminal, terminal_value, projected_fcf = _dcf_core(
+                float(fcf), float(growth_rate), float(discount_rate),
+                float(terminal_growth_rate), int(high_growth_years)
+            )
+            projected_fcf = projected_fcf.tolist()
         
         # Total Enterprise Value
         total_pv = stage1_value + pv_terminal
@@ -354,6 +648,94 @@ class ValuationEngine:
             }
         }
     
+    def calculate_dcf_batch(
+        self,
+        fcf,
+        growth_rates,
+        discount_rates=0.10,
+        terminal_growth_rates=0.03,
+        high_growth_years=5,
+        shares_outstanding=None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate many 2-Stage DCFs at once (sensitivity grids, Monte Carlo draws)
+        
+        All inputs broadcast against each other. Inputs are sanitized the same way
+        as calculate_dcf (unrealistic growth -> 10%, discount rate <= terminal
+        growth -> terminal growth + 5%), silently and per element.
+        
+        Args:
+            fcf: Current Free Cash Flow (scalar or array)
+            growth_rates: Annual growth rates (Stage 1)
+            discount_rates: Required rates of return (WACC)
+            terminal_growth_rates: Perpetual growth rates
+            high_growth_years: Years of high growth
+            shares_outstanding: Number of shares (None -> no per-share value)
+            
+        Returns:
+            Dictionary of float64 arrays (NaN where FCF <= 0, or per-share value
+            without a positive share count)
+        """
+        fcf, g, r, tg, n, shares = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(fcf, dtype=np.float64)),
+            np.asarray(growth_rates, dtype=np.float64),
+            np.asarray(discount_rates, dtype=np.float64),
+            np.asarray(terminal_growth_rates, dtype=np.float64),
+            np.asarray(high_growth_years, dtype=np.float64),
+            np.asarray(np.nan if shares_outstanding is None else shares_outstanding, dtype=np.float64),
+        )
+        
+        # Validation (vectorized counterpart of calculate_dcf's checks)
+        g = np.where((g <= 0) | (g > 1.0), 0.10, g)
+        r = np.where(r <= tg, tg + 0.05, r)
+        fcf = np.where(fcf > 0, fcf, np.nan)
+        
+        one_plus_g = 1.0 + g
+        one_plus_r = 1.0 + r
+        d = (g - r) / one_plus_r
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stage1_value = np.where(d == 0.0, fcf * n, fcf * (1.0 + d) * np.expm1(n * np.log1p(d)) / d)
+            terminal_value = fcf * one_plus_g ** (n + 1) / (r - tg)
+            pv_terminal = terminal_value / one_plus_r ** n
+            total_pv = stage1_value + pv_terminal
+            intrinsic_value_per_share = np.where(shares > 0, total_pv / shares, np.nan)
+        
+        return {
+            'intrinsic_value_per_share': intrinsic_value_per_share,
+            'total_present_value': total_pv,
+            'stage1_value': stage1_value,
+            'terminal_value': pv_terminal,
+            'terminal_value_undiscounted': terminal_value,
+            'discount_rate': r,
+            'growth_rate': g,
+            'terminal_growth_rate': tg,
+        }
+    
+    def calculate_dcf_frame(self, frame):
+        """
+        Calculate DCFs for a table of companies (one row each) in a single batch
+        
+        Args:
+            frame: pandas DataFrame with an 'fcf' and a 'growth_rate' column, plus
+                optional 'discount_rate', 'terminal_growth_rate', 'high_growth_years'
+                and 'shares_outstanding' columns (missing ones use calculate_dcf's
+                defaults)
+            
+        Returns:
+            DataFrame of calculate_dcf_batch results, indexed like `frame`
+        """
+        import pandas as pd
+        
+        def column_array(column):
+            return np.ascontiguousarray(frame[column].to_numpy(dtype=np.float64))
+        
+        inputs = {'fcf': column_array('fcf'), 'growth_rates': column_array('growth_rate')}
+        for column, argument, default in _DCF_FRAME_COLUMNS:
+            inputs[argument] = column_array(column) if column in frame else default
+        
+        return pd.DataFrame(self.calculate_dcf_batch(**inputs), index=frame.index)
+    
     def calculate_margin_of_safety(
         self,
         intrinsic_value: float,
@@ -369,27 +751,16 @@ class ValuationEngine:
             current_price: Current market price
             
         Returns:
-            Dictionary with MOS analysis
+            Dictionary with MOS analysis (a shared read-only mapping when
+            intrinsic_value <= 0 or either input is NaN)
         """
-        if intrinsic_value <= 0:
-            return {
-                'margin_of_safety_%': None,
-                'recommendation': 'Cannot calculate - invalid intrinsic value'
-            }
+        if not intrinsic_value > 0 or not math.isfinite(current_price):
+            return _MOS_INVALID_VALUE
         
         mos = ((intrinsic_value - current_price) / intrinsic_value) * 100
         
         # Assessment
-        if mos > 25:
-            assessment = "🟢 STRONG BUY - Significant undervaluation"
-        elif mos > 10:
-            assessment = "🟡 BUY - Moderate undervaluation"
-        elif mos > -10:
-            assessment = "⚪ FAIR - Roughly fairly valued"
-        elif mos > -25:
-            assessment = "🟠 CAUTION - Moderately overvalued"
-        else:
-            assessment = "🔴 AVOID - Significantly overvalued"
+        assessment = str(_MOS_ASSESSMENTS[_tier_index(_MOS_BOUNDS, mos)])
         
         return {
             'margin_of_safety_%': mos,
@@ -400,6 +771,38 @@ class ValuationEngine:
             'price_to_value_ratio': current_price / intrinsic_value if intrinsic_value else None
         }
     
+    def calculate_margin_of_safety_batch(self, intrinsic_values, current_prices) -> Dict[str, np.ndarray]:
+        """
+        Calculate Margin of Safety for many positions at once
+        
+        Args:
+            intrinsic_values: Calculated fair values (array-like)
+            current_prices: Current market prices (array-like, broadcast against values)
+            
+        Returns:
+            Dictionary of arrays (NaN MOS / empty assessment where intrinsic value <= 0
+            or either input is NaN)
+        """
+        intrinsic_values, current_prices = np.broadcast_arrays(
+            np.asarray(intrinsic_values, dtype=np.float64),
+            np.asarray(current_prices, dtype=np.float64),
+        )
+        valid = (intrinsic_values > 0) & np.isfinite(current_prices)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mos = np.where(valid, (intrinsic_values - current_prices) / intrinsic_values * 100, np.nan)
+            price_to_value = np.where(valid, current_prices / intrinsic_values, np.nan)
+        assessment = np.where(valid, _MOS_ASSESSMENTS[_tier_index(_MOS_BOUNDS, mos)], '')
+        
+        return {
+            'margin_of_safety_%': mos,
+            'intrinsic_value': intrinsic_values,
+            'current_price': current_prices,
+            'upside_downside_%': mos,
+            'assessment': assessment,
+            'price_to_value_ratio': price_to_value
+        }
+    
     def format_dcf_report(
         self,
         dcf_result: Dict,
@@ -416,77 +819,25 @@ class ValuationEngine:
             Formatted report string
         """
         if 'error' in dcf_result:
-            return f"""
-DCF VALUATION - ERROR
----------------------
-⚠️  {dcf_result['error']}
-
-DCF calculation could not be completed.
-"""
+            return _REPORT_ERROR_TMPL.format_map(dcf_result)
         
-        report = f"""
-================================================================================
-DISCOUNTED CASH FLOW (DCF) VALUATION
-================================================================================
-
-📊 INTRINSIC VALUE CALCULATION:
-
-Total Enterprise Value: ${dcf_result['total_present_value']:,.0f}
-"""
+        per_share_line = ''
+        mos_section = ''
         
         if dcf_result['intrinsic_value_per_share']:
-            report += f"Intrinsic Value Per Share: ${dcf_result['intrinsic_value_per_share']:.2f}\n"
-        
-        report += f"""
-BREAKDOWN:
-- Stage 1 Value (High Growth): ${dcf_result['stage1_value']:,.0f}
-- Stage 2 Value (Terminal): ${dcf_result['terminal_value']:,.0f}
-
-ASSUMPTIONS USED:
-- Current FCF: ${dcf_result['assumptions']['current_fcf']:,.0f}
-- High Growth Period: {dcf_result['assumptions']['high_growth_years']} years
-- Growth Rate (Stage 1): {dcf_result['assumptions']['growth_rate_%']:.1f}%
-- Discount Rate (WACC): {dcf_result['assumptions']['discount_rate_%']:.1f}%
-- Terminal Growth Rate: {dcf_result['assumptions']['terminal_growth_%']:.1f}%
-"""
+            per_share_line = _REPORT_PER_SHARE_TMPL.format_map(dcf_result)
         
         if current_price and dcf_result['intrinsic_value_per_share']:
             mos_result = self.calculate_margin_of_safety(
                 dcf_result['intrinsic_value_per_share'],
                 current_price
             )
-            
-            report += f"""
-================================================================================
-MARGIN OF SAFETY ANALYSIS
-================================================================================
-
-Current Market Price: ${current_price:.2f}
-DCF Intrinsic Value: ${dcf_result['intrinsic_value_per_share']:.2f}
-
-Margin of Safety: {mos_result['margin_of_safety_%']:.1f}%
-Price/Value Ratio: {mos_result['price_to_value_ratio']:.2f}x
-
-{mos_result['assessment']}
-
-Interpretation:
-- If MOS > 25%: Strong Buy Signal (significant undervaluation)
-- If MOS 10-25%: Buy Signal (moderate undervaluation)
-- If MOS -10 to +10%: Fairly Valued
-- If MOS < -25%: Avoid (significantly overvalued)
-
-Current Assessment: {"UNDERVALUED ✓" if mos_result['margin_of_safety_%'] > 0 else "OVERVALUED ✗"}
-Potential Upside/Downside: {mos_result['margin_of_safety_%']:+.1f}%
-"""
-        
-        report += """
-================================================================================
-IMPORTANT NOTES FOR ANALYSIS:
-- DCF is sensitive to growth rate assumptions - test different scenarios
-- Market may disagree with DCF due to different risk assessments
-- Use DCF as ONE input alongside qualitative factors
-- Skeptics should question growth and discount rate assumptions
-================================================================================
-"""
+            # No MOS section when it cannot be calculated (e.g. a NaN price)
+            if mos_result['margin_of_safety_%'] is not None:
+                status = "UNDERVALUED ✓" if mos_result['margin_of_safety_%'] > 0 else "OVERVALUED ✗"
+                mos_section = _REPORT_MOS_TMPL.format_map({**mos_result, 'status': status})
         
+        report = _REPORT_TMPL.format_map(
+            {**dcf_result, 'per_share_line': per_share_line, 'mos_section': mos_section}
+        )
         return report.strip()